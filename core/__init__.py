@@ -2,9 +2,9 @@
 Core module - Núcleo comum de interfaces e abstrações
 """
 
-from .algorithm_base import AlgorithmBase
+from .algorithm_base import AlgorithmBase, Probe
 from .experiment_runner import ExperimentRunner
 from .metrics import Metrics
 from .visualizer import Visualizer
 
-__all__ = ['AlgorithmBase', 'ExperimentRunner', 'Metrics', 'Visualizer']
+__all__ = ['AlgorithmBase', 'Probe', 'ExperimentRunner', 'Metrics', 'Visualizer']
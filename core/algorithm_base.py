@@ -4,14 +4,35 @@ Define a interface comum que todos os algoritmos devem implementar
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List
 import time
 
 
+class Probe:
+    """
+    Gancho de instrumentação do pipeline de execução.
+    
+    before() é chamado logo antes de o cronômetro começar e after() logo
+    depois de ele parar (mesmo se solve() lançar exceção), então o custo da
+    sonda não entra em execution_time. Sondas podem ler e escrever em
+    algorithm.metrics; after() já encontra execution_time preenchido.
+    """
+    
+    def before(self, algorithm: 'AlgorithmBase'):
+        pass
+    
+    def after(self, algorithm: 'AlgorithmBase'):
+        pass
+
+
 class AlgorithmBase(ABC):
     """
     Classe base para todos os algoritmos implementados.
     Fornece estrutura comum para execução, métricas e comparação.
+    
+    Toda execução passa por run(): as métricas são zeradas, as sondas
+    registradas rodam em volta de solve(), que é cronometrado por
+    self.timer. Subclasses implementam apenas solve().
     """
     
     def __init__(self, name: str):
@@ -20,6 +41,9 @@ class AlgorithmBase(ABC):
             name: Nome descritivo do algoritmo
         """
         self.name = name
+        self.counting_enabled = True
+        self.timer: Callable[[], float] = time.perf_counter
+        self.probes: List[Probe] = []
         self.metrics = {
             'execution_time': 0.0,
             'operations_count': 0,
@@ -30,10 +54,8 @@ class AlgorithmBase(ABC):
     def solve(self, *args, **kwargs) -> Any:
         """
         Método principal que resolve o problema.
-        Deve ser implementado por cada algoritmo específico.
-        
-        Nota: Se você sobrescrever o método run(), pode deixar solve() 
-        retornando NotImplementedError.
+        Deve ser implementado por cada algoritmo específico e é chamado
+        por run(), que cuida das métricas.
         """
         pass
     
@@ -44,18 +66,50 @@ class AlgorithmBase(ABC):
         Returns:
             Dict com resultado e métricas de execução
         """
-        start_time = time.perf_counter()
-        
-        result = self.solve(*args, **kwargs)
+        return self._instrumented(self.solve, args, kwargs)
+    
+    def _instrumented(self, fn: Callable, args: tuple, kwargs: dict) -> Dict[str, Any]:
+        """
+        Pipeline comum de execução: zera as métricas, chama before() das
+        sondas, cronometra fn(*args, **kwargs) e chama after() das sondas
+        em ordem inversa.
         
-        end_time = time.perf_counter()
-        self.metrics['execution_time'] = end_time - start_time
+        Returns:
+            Dict com resultado e cópia das métricas
+        """
+        self.reset_metrics()
+        probes = self.probes
+        for probe in probes:
+            probe.before(self)
+        timer = self.timer
+        try:
+            start = timer()
+            result = fn(*args, **kwargs)
+            self.metrics['execution_time'] = timer() - start
+        finally:
+            for probe in reversed(probes):
+                probe.after(self)
         
         return {
             'result': result,
             'metrics': self.metrics.copy()
         }
     
+    def set_timer(self, timer: Callable[[], float]):
+        """
+        Troca o relógio usado por run() (ex.: time.process_time para tempo
+        de CPU). Deve devolver segundos como float.
+        """
+        self.timer = timer
+    
+    def add_probe(self, probe: Probe):
+        """Registra uma sonda chamada em volta de cada execução"""
+        self.probes.append(probe)
+    
+    def remove_probe(self, probe: Probe):
+        """Remove uma sonda registrada com add_probe()"""
+        self.probes.remove(probe)
+    
     def reset_metrics(self):
         """Reseta as métricas para nova execução"""
         self.metrics = {
@@ -64,15 +118,33 @@ class AlgorithmBase(ABC):
             'memory_usage': 0
         }
     
+    def set_counting(self, enabled: bool):
+        """
+        Liga ou desliga a contagem de operações.
+        
+        Com a contagem desligada, count() não altera as métricas, e as
+        execuções medem o algoritmo sem a instrumentação (passe de tempo).
+        Os laços internos acumulam as operações numa variável local e
+        chamam count() uma vez no fim, então o custo residual é pequeno.
+        
+        Args:
+            enabled: True para contar operações, False para apenas executar
+        """
+        self.counting_enabled = enabled
+    
     def count(self, operations: int = 1):
         """
         Incrementa o contador de operações.
         Método auxiliar para facilitar contagem durante execução.
         
+        Em laços críticos prefira acumular numa variável local e chamar
+        count(total) uma única vez.
+        
         Args:
             operations: Número de operações a incrementar (padrão: 1)
         """
-        self.metrics['operations_count'] += operations
+        if self.counting_enabled:
+            self.metrics['operations_count'] += operations
     
     def __str__(self):
         return f"Algorithm: {self.name}"
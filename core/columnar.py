@@ -0,0 +1,175 @@
+"""
+Armazenamento colunar de resultados
+Exporta registros de experimentos para Parquet (pandas + pyarrow) ou, sem
+pyarrow, para .npz do NumPy, e carrega as colunas numéricas por memory-map
+para comparar muitos históricos sem reprocessar JSON
+"""
+
+import importlib.util
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+PARQUET = 'parquet'
+NPZ = 'npz'
+
+# Tipos de coluna carregados por memory-map no .npz
+_MAPPABLE_KINDS = 'biufcmM'
+
+
+def parquet_available() -> bool:
+    """True se pandas consegue gravar Parquet (engine pyarrow instalada)"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def _column(name: str, values: List[Any]) -> np.ndarray:
+    """
+    Converte os valores de uma coluna num vetor tipado: inteiros (int64,
+    ou float64 com NaN se faltar valor), números (float64), timestamp
+    ISO (datetime64[us]) e o resto como texto (valores não textuais em
+    JSON, ausentes como '').
+    """
+    present = [v for v in values if v is not None]
+    complete = len(present) == len(values)
+
+    if present and all(isinstance(v, (bool, np.bool_)) for v in present):
+        if complete:
+            return np.array(values, dtype=bool)
+    elif present and all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in present):
+        if complete and all(isinstance(v, (int, np.integer)) for v in present):
+            try:
+                return np.array(values, dtype=np.int64)
+            except OverflowError:
+                pass
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    elif name == 'timestamp' and all(isinstance(v, str) for v in present):
+        return np.array([v or 'NaT' for v in values], dtype='datetime64[us]')
+
+    return np.array(
+        ['' if v is None else v if isinstance(v, str) else json.dumps(v, ensure_ascii=False) for v in values],
+        dtype=str
+    )
+
+
+def records_to_columns(records: Iterable[Dict[str, Any]], include_result: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Achata registros de ExperimentRunner em colunas.
+
+    Dicts aninhados viram colunas "chave.subchave" (metrics.execution_time,
+    statistics.median, profile.pstats, ...); registros sem uma coluna
+    recebem NaN / NaT / ''. Parâmetros não numéricos (tuplas, textos) ficam
+    como texto JSON.
+
+    Args:
+        records: Registros (lista, ou o gerador de read_results)
+        include_result: Se False (padrão), descarta o 'result' de cada
+                        execução, que costuma ser a maior parte do JSON
+
+    Returns:
+        Dict {coluna: vetor NumPy}, todas com o mesmo comprimento
+    """
+    rows = []
+    names = {}
+    for record in records:
+        row = {}
+        for key, value in record.items():
+            if key == 'result' and not include_result:
+                continue
+            if isinstance(value, dict):
+                for sub, sub_value in value.items():
+                    row[f'{key}.{sub}'] = sub_value
+            else:
+                row[key] = value
+        names.update(dict.fromkeys(row))
+        rows.append(row)
+
+    return {name: _column(name, [row.get(name) for row in rows]) for name in names}
+
+
+def export_columnar(
+    records: Iterable[Dict[str, Any]],
+    path: Union[str, Path],
+    include_result: bool = False,
+    fmt: Optional[str] = None
+) -> Path:
+    """
+    Grava os registros em formato colunar.
+
+    Args:
+        records: Registros de ExperimentRunner
+        path: Arquivo de saída; a extensão é trocada pela do formato
+        include_result: Inclui a coluna 'result' (como texto JSON)
+        fmt: PARQUET ou NPZ (padrão: Parquet se pyarrow estiver
+             disponível, senão .npz sem compressão)
+
+    Returns:
+        Caminho do arquivo gravado
+    """
+    fmt = fmt or (PARQUET if parquet_available() else NPZ)
+    if fmt not in (PARQUET, NPZ):
+        raise ValueError(f'formato desconhecido: {fmt}')
+    columns = records_to_columns(records, include_result)
+    path = Path(path).with_suffix(f'.{fmt}')
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if fmt == PARQUET:
+        import pandas as pd
+        pd.DataFrame(columns).to_parquet(path, engine='pyarrow', index=False)
+    else:
+        # savez (sem compressão) grava cada coluna como um .npy contíguo no zip
+        with open(path, 'wb') as f:
+            np.savez(f, **columns)
+    return path
+
+
+def _npy_offset(f, info: zipfile.ZipInfo) -> int:
+    """Posição, no arquivo, do início dos dados de um membro .npy"""
+    f.seek(info.header_offset)
+    local_header = f.read(30)
+    name_len = int.from_bytes(local_header[26:28], 'little')
+    extra_len = int.from_bytes(local_header[28:30], 'little')
+    return info.header_offset + 30 + name_len + extra_len
+
+
+def load_columnar(path: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """
+    Carrega um arquivo gravado por export_columnar.
+
+    No .npz, colunas numéricas e de data viram np.memmap somente leitura
+    apontando para o trecho do arquivo onde estão (nada é lido até o uso);
+    colunas de texto são carregadas normalmente. No Parquet, a leitura usa
+    memory_map do pyarrow.
+
+    Returns:
+        Dict {coluna: vetor}; pd.DataFrame(colunas) monta a tabela
+    """
+    path = Path(path)
+    if path.suffix == f'.{PARQUET}':
+        import pandas as pd
+        df = pd.read_parquet(path, engine='pyarrow', memory_map=True)
+        return {name: df[name].to_numpy() for name in df.columns}
+
+    columns = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            name = info.filename[:-len('.npy')]
+            if info.compress_type != zipfile.ZIP_STORED:
+                columns[name] = np.load(archive.open(info))
+                continue
+            f.seek(_npy_offset(f, info))
+            if np.lib.format.read_magic(f) == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.kind in _MAPPABLE_KINDS and int(np.prod(shape)) > 0:
+                columns[name] = np.memmap(
+                    path, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                    order='F' if fortran_order else 'C'
+                )
+            else:
+                f.seek(_npy_offset(f, info))
+                columns[name] = np.lib.format.read_array(f)
+    return columns
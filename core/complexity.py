@@ -0,0 +1,190 @@
+"""
+Análise de complexidade empírica
+Ajusta tempos/contagens de operações a modelos de crescimento e extrapola
+o maior n resolvível dentro de um orçamento de tempo
+"""
+
+from typing import List, Dict, Any, Callable, Optional, Sequence, Tuple, Union
+import math
+
+import numpy as np
+
+
+# Modelos de crescimento em escala logarítmica: log g(n, m)
+MODELS: Dict[str, Callable] = {
+    'n': lambda n, m: np.log(n),
+    'n log n': lambda n, m: np.log(n) + np.log(np.log2(np.maximum(n, 2))),
+    'n^2': lambda n, m: 2 * np.log(n),
+    'nm': lambda n, m: np.log(n) + np.log(m),
+    '2^n': lambda n, m: n * math.log(2),
+    '3^n': lambda n, m: n * math.log(3),
+}
+
+Size = Union[float, Tuple[float, float]]
+
+# Orçamento padrão (s) para extrapolar o maior n resolvível de cada algoritmo
+DEFAULT_TIME_BUDGET = 60.0
+
+
+def _split_sizes(sizes: Sequence[Size]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Separa tamanhos escalares n ou pares (n, m) em dois vetores"""
+    if sizes and isinstance(sizes[0], (tuple, list)):
+        n = np.array([s[0] for s in sizes], dtype=float)
+        m = np.array([s[1] for s in sizes], dtype=float)
+        return n, m
+    return np.asarray(sizes, dtype=float), None
+
+
+def fit_complexity(
+    sizes: Sequence[Size],
+    values: Sequence[float],
+    models: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Ajusta y = c * g(n) para cada modelo candidato por mínimos quadrados em
+    escala log (log y = log c + log g(n)) e escolhe o de menor resíduo.
+
+    Também ajusta as duas formas livres: potência (log y = a + k log n, com
+    k como expoente) e exponencial (log y = a + n log b, com b como base).
+
+    Args:
+        sizes: Tamanhos n, ou pares (n, m) para habilitar o modelo nm
+        values: Tempos ou contagens de operações (valores <= 0 são ignorados)
+        models: Nomes de MODELS a considerar (padrão: todos os aplicáveis)
+
+    Returns:
+        Dict com best, coefficient, exponent, growth_base, m_ratio,
+        n_points e models ({nome: {coefficient, rss, r2}})
+    """
+    n, m = _split_sizes(list(sizes))
+    y = np.asarray(values, dtype=float)
+    mask = (y > 0) & (n > 0)
+    if m is not None:
+        mask &= m > 0
+    n, y = n[mask], y[mask]
+    m = m[mask] if m is not None else None
+    if len(y) < 2:
+        raise ValueError("são necessários pelo menos 2 pontos positivos")
+
+    log_y = np.log(y)
+    total_ss = float(np.sum((log_y - log_y.mean()) ** 2))
+    candidates = models or [name for name in MODELS if name != 'nm' or m is not None]
+
+    fits = {}
+    for name in candidates:
+        if name == 'nm' and m is None:
+            raise ValueError("o modelo nm exige tamanhos (n, m)")
+        log_g = MODELS[name](n, m)
+        # Único parâmetro livre: log c = média de log y - log g
+        log_c = float(np.mean(log_y - log_g))
+        rss = float(np.sum((log_y - log_g - log_c) ** 2))
+        fits[name] = {
+            'coefficient': math.exp(log_c),
+            'rss': rss,
+            'r2': 1 - rss / total_ss if total_ss > 0 else 1.0
+        }
+
+    best = min(fits, key=lambda name: fits[name]['rss'])
+
+    # Formas livres, também em escala log
+    design = np.column_stack([np.ones_like(n), np.log(n)])
+    (_, exponent), *_ = np.linalg.lstsq(design, log_y, rcond=None)
+    design = np.column_stack([np.ones_like(n), n])
+    (_, log_base), *_ = np.linalg.lstsq(design, log_y, rcond=None)
+
+    return {
+        'best': best,
+        'coefficient': fits[best]['coefficient'],
+        'exponent': float(exponent),
+        'growth_base': float(math.exp(log_base)),
+        'm_ratio': float(np.mean(m / n)) if m is not None else None,
+        'n_points': int(len(y)),
+        'models': fits
+    }
+
+
+def predict(fit: Dict[str, Any], n: float, model: Optional[str] = None) -> float:
+    """
+    Valor previsto c * g(n) pelo modelo ajustado (o melhor, por padrão).
+    No modelo nm, m é estimado como m_ratio * n.
+    """
+    model = model or fit['best']
+    m = (fit['m_ratio'] or 1.0) * n
+    log_value = math.log(fit['models'][model]['coefficient']) + float(MODELS[model](np.float64(n), m))
+    return math.exp(log_value) if log_value < 700 else math.inf
+
+
+def max_size_within(fit: Dict[str, Any], budget: float, limit: int = 10**12) -> int:
+    """
+    Maior n inteiro cujo valor previsto pelo melhor modelo cabe em `budget`.
+
+    Busca exponencial seguida de busca binária (os modelos são crescentes).
+
+    Returns:
+        O maior n (0 se nem n=1 cabe; `limit` se o orçamento nunca é atingido)
+    """
+    if predict(fit, 1) > budget:
+        return 0
+    hi = 2
+    while hi < limit and predict(fit, hi) <= budget:
+        hi *= 2
+    if hi >= limit and predict(fit, limit) <= budget:
+        return limit
+    lo = hi // 2
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if predict(fit, mid) <= budget:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def analyze_results(
+    results: List[Dict[str, Any]],
+    metric: str = 'execution_time',
+    size_fn: Optional[Callable[[Any], Size]] = None,
+    budget: Optional[float] = None,
+    models: Optional[List[str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Ajusta os registros de run_series (um ponto por parâmetro, mediana das
+    repetições) para cada algoritmo.
+
+    Args:
+        results: Registros com 'algorithm', 'parameter' e 'metrics'
+        metric: Métrica ajustada (execution_time ou operations_count)
+        size_fn: Converte o parâmetro em n ou (n, m) (padrão: o próprio parâmetro)
+        budget: Se dado, inclui max_n_within_budget (mesma unidade da métrica)
+        models: Modelos candidatos (padrão: todos os aplicáveis)
+
+    Returns:
+        Dict {algoritmo: resultado de fit_complexity (+ max_n_within_budget)};
+        algoritmos com menos de 2 pontos ficam de fora
+    """
+    size_fn = size_fn or (lambda param: param)
+    points = {}
+    for r in results:
+        value = r.get('metrics', {}).get(metric)
+        if r.get('status') is not None or value is None:
+            continue
+        points.setdefault(r['algorithm'], {}).setdefault(r['parameter'], []).append(value)
+
+    analysis = {}
+    for algorithm, by_param in points.items():
+        params = list(by_param)
+        try:
+            fit = fit_complexity(
+                [size_fn(p) for p in params],
+                [float(np.median(by_param[p])) for p in params],
+                models
+            )
+        except ValueError:
+            continue
+        fit['metric'] = metric
+        if budget is not None:
+            fit['budget'] = budget
+            fit['max_n_within_budget'] = max_size_within(fit, budget)
+        analysis[algorithm] = fit
+
+    return analysis
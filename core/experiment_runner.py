@@ -3,12 +3,275 @@ Executor de experimentos padronizados
 Permite executar múltiplos algoritmos com diferentes entradas e comparar resultados
 """
 
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union
+import gc
 import json
+import math
+import multiprocessing
+import os
+import re
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.connection import wait
 from datetime import datetime
 from pathlib import Path
 
+from . import columnar
 from .algorithm_base import AlgorithmBase
+from .complexity import analyze_results
+from .metrics import MemoryProbe, summarize_samples
+from .profiling import CProfileProbe, StackProbe
+from .result_sink import ResultSink, read_results, record_key
+
+
+# Valor de 'status' dos registros de execuções interrompidas pelo limite de tempo
+TIMEOUT = "timeout"
+
+# Limite (s) de cada execução nas séries com algoritmos exponenciais
+RUN_TIMEOUT = 30
+
+# Repetições descartadas porque outra repetição do mesmo algoritmo estourou o limite
+_SKIPPED = object()
+
+# Modos de contagem de operações de um job:
+# "inline" conta durante a execução medida (comportamento original),
+# "separate" faz um passe de contagem e depois um passe de tempo sem contagem,
+# "off" só mede o tempo (a contagem vem do job "separate" do mesmo grupo)
+COUNT_INLINE = "inline"
+COUNT_SEPARATE = "separate"
+COUNT_OFF = "off"
+
+# Modos do passe de memória de um job: só tracemalloc ou também o RSS amostrado
+MEMORY_TRACED = "traced"
+MEMORY_RSS = "rss"
+
+
+def _count_operations(algorithm: AlgorithmBase, args: tuple, kwargs: dict) -> int:
+    """Passe de contagem: executa com a contagem ligada e devolve operations_count"""
+    algorithm.set_counting(True)
+    return algorithm.run(*args, **kwargs)['metrics']['operations_count']
+
+
+def _profile_memory(algorithm: AlgorithmBase, args: tuple, kwargs: dict, memory: str) -> Dict[str, float]:
+    """
+    Passe de memória: executa com uma MemoryProbe registrada e a contagem
+    desligada.
+    
+    Returns:
+        Métricas a mesclar no resultado: memory_usage (pico do tracemalloc,
+        em MB) e, no modo MEMORY_RSS, memory_rss_peak e memory_rss_delta
+    """
+    probe = MemoryProbe(sample_rss=(memory == MEMORY_RSS))
+    previous = algorithm.counting_enabled
+    algorithm.set_counting(False)
+    algorithm.add_probe(probe)
+    try:
+        metrics = algorithm.run(*args, **kwargs)['metrics']
+    finally:
+        algorithm.remove_probe(probe)
+        algorithm.set_counting(previous)
+    
+    return {name: metrics[name] for name in MemoryProbe.METRICS if name in metrics}
+
+
+def _profile_run(algorithm: AlgorithmBase, args: tuple, kwargs: dict, stem: str) -> Dict[str, str]:
+    """
+    Passe de perfil, com a contagem desligada: uma execução sob cProfile
+    (stem.pstats) e outra sob StackProbe (stem.collapsed).
+    
+    Returns:
+        Dict com os caminhos dos arquivos gravados ('pstats' e 'collapsed')
+    """
+    paths = {'pstats': f"{stem}.pstats", 'collapsed': f"{stem}.collapsed"}
+    previous = algorithm.counting_enabled
+    algorithm.set_counting(False)
+    try:
+        for probe in (CProfileProbe(paths['pstats']), StackProbe(paths['collapsed'])):
+            algorithm.add_probe(probe)
+            try:
+                algorithm.run(*args, **kwargs)
+            finally:
+                algorithm.remove_probe(probe)
+    finally:
+        algorithm.set_counting(previous)
+    return paths
+
+
+def _restore_parameter(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Registros lidos de JSON trazem parâmetros-tupla como listas; volta a tupla"""
+    if isinstance(record.get('parameter'), list):
+        record['parameter'] = tuple(record['parameter'])
+    return record
+
+
+def _slug(value: Any) -> str:
+    """Trecho seguro para nomes de arquivo"""
+    return re.sub(r'[^\w.-]+', '_', str(value)).strip('_')
+
+
+def _execute_run(
+    algorithm: AlgorithmBase,
+    args: tuple,
+    kwargs: dict,
+    counting: str = COUNT_INLINE,
+    memory: Optional[str] = None
+) -> Dict[str, Any]:
+    """Executa uma repetição isolada (função de módulo para ser enviada a processos)"""
+    memory_metrics = _profile_memory(algorithm, args, kwargs, memory) if memory else None
+    
+    if counting == COUNT_INLINE:
+        result_data = algorithm.run(*args, **kwargs)
+    else:
+        previous = algorithm.counting_enabled
+        try:
+            operations = _count_operations(algorithm, args, kwargs) if counting == COUNT_SEPARATE else None
+            algorithm.set_counting(False)
+            result_data = algorithm.run(*args, **kwargs)
+        finally:
+            algorithm.set_counting(previous)
+        
+        if operations is not None:
+            result_data['metrics']['operations_count'] = operations
+    
+    if memory_metrics:
+        result_data['metrics'].update(memory_metrics)
+    return result_data
+
+
+def _timed_loop(algorithm: AlgorithmBase, args: tuple, kwargs: dict, number: int):
+    """
+    Executa solve() `number` vezes seguidas com o GC desligado. O relógio
+    envolve só o laço: o pipeline de run() (zerar e copiar as métricas,
+    sondas) fica de fora, pois pesa nas execuções de microssegundos.
+    
+    As métricas são zeradas uma vez antes do laço; como os algoritmos são
+    determinísticos, o operations_count acumulado é dividido por `number`.
+    
+    Returns:
+        Tupla (tempo total em s, resultado da última execução no formato
+        de run())
+    """
+    algorithm.reset_metrics()
+    solve = algorithm.solve
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timer = algorithm.timer
+        start = timer()
+        for _ in range(number):
+            result = solve(*args, **kwargs)
+        elapsed = timer() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    
+    metrics = algorithm.metrics.copy()
+    metrics['operations_count'] //= number
+    return elapsed, {'result': result, 'metrics': metrics}
+
+
+def _calibrate(algorithm: AlgorithmBase, args: tuple, kwargs: dict, min_time: float) -> int:
+    """Menor número de execuções em 1, 2, 5, 10, 20, 50, ... que soma `min_time` (timeit.autorange)"""
+    scale = 1
+    while True:
+        for m in (1, 2, 5):
+            number = m * scale
+            elapsed, _ = _timed_loop(algorithm, args, kwargs, number)
+            if elapsed >= min_time:
+                return number
+        scale *= 10
+
+
+def _execute_benchmark(
+    algorithm: AlgorithmBase,
+    args: tuple,
+    kwargs: dict,
+    counting: str = COUNT_INLINE,
+    memory: Optional[str] = None,
+    *,
+    repetitions: int = 5,
+    warmup: int = 1,
+    min_time: float = 0.2
+) -> List[Dict[str, Any]]:
+    """
+    Mede um algoritmo no estilo do timeit: aquece, calibra o número de
+    execuções por amostra (1, 2, 5, 10, 20, 50, ... até somar `min_time`)
+    e coleta `repetitions` amostras com o GC desligado.
+    
+    Fora do modo COUNT_INLINE, aquecimento, calibração e amostras rodam com
+    a contagem desligada; no modo COUNT_SEPARATE um passe de contagem
+    anterior fornece o operations_count de todas as amostras. Com `memory`,
+    um passe de memória anterior fornece as métricas de memória.
+    
+    Returns:
+        Um resultado de run() por amostra, com execution_time igual ao tempo
+        médio por execução da amostra e inner_loops com o número de execuções
+    """
+    memory_metrics = _profile_memory(algorithm, args, kwargs, memory) if memory else None
+    
+    previous = algorithm.counting_enabled
+    try:
+        operations = _count_operations(algorithm, args, kwargs) if counting == COUNT_SEPARATE else None
+        algorithm.set_counting(counting == COUNT_INLINE)
+        
+        for _ in range(warmup):
+            algorithm.solve(*args, **kwargs)
+        
+        number = _calibrate(algorithm, args, kwargs, min_time)
+        
+        outputs = []
+        for _ in range(repetitions):
+            elapsed, result_data = _timed_loop(algorithm, args, kwargs, number)
+            result_data['metrics']['execution_time'] = elapsed / number
+            result_data['metrics']['inner_loops'] = number
+            if operations is not None:
+                result_data['metrics']['operations_count'] = operations
+            if memory_metrics:
+                result_data['metrics'].update(memory_metrics)
+            outputs.append(result_data)
+    finally:
+        algorithm.set_counting(previous)
+    return outputs
+
+
+def _pin_worker(counter, cores: List[int]):
+    """
+    Inicializador dos processos: fixa cada processo em um núcleo diferente,
+    na ordem em que eles sobem, para reduzir o ruído das medições de tempo.
+    """
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    os.sched_setaffinity(0, {cores[index % len(cores)]})
+
+
+def _run_in_child(conn, fn: Callable, job: tuple, core: Optional[int]):
+    """
+    Executa uma repetição num processo próprio e envia o resultado pelo
+    pipe. O processo abre um grupo próprio para que um estouro de tempo
+    encerre também os processos que o algoritmo criar (workers).
+    """
+    os.setpgrp()
+    if core is not None:
+        os.sched_setaffinity(0, {core})
+    try:
+        conn.send(('ok', fn(*job)))
+    except Exception as e:
+        conn.send(('error', f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def _kill_child(process: multiprocessing.Process):
+    """Encerra o processo de _run_in_child e todo o seu grupo"""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        # O filho ainda não abriu o grupo (e, portanto, não criou processos)
+        process.kill()
+    process.join()
 
 
 class ExperimentRunner:
@@ -16,22 +279,257 @@ class ExperimentRunner:
     Gerencia a execução de experimentos comparativos entre algoritmos.
     """
     
-    def __init__(self, name: str, output_dir: str = "results/logs"):
+    def __init__(
+        self,
+        name: str,
+        output_dir: str = "results/logs",
+        workers: Optional[int] = None,
+        pin_workers: bool = False
+    ):
         """
         Args:
             name: Nome do experimento
             output_dir: Diretório para salvar resultados
+            workers: Número de processos para executar as repetições em
+                     paralelo. None ou 1 executa tudo no processo atual
+            pin_workers: Se True, fixa cada processo em um núcleo (Linux)
         """
+        if workers is not None and workers < 1:
+            raise ValueError("workers deve ser positivo ou None")
         self.name = name
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        self.pin_workers = pin_workers
         self.results = []
+        self.stream_path = None
+    
+    def _dispatch(
+        self,
+        jobs: List[Tuple[AlgorithmBase, tuple, dict, str]],
+        workers: Optional[int] = None,
+        fn: Callable = _execute_run
+    ) -> List[Any]:
+        """
+        Executa as repetições (algoritmo, args, kwargs, contagem) e devolve os
+        resultados na mesma ordem de `jobs`, seja em série, seja num pool
+        de processos.
+        
+        Args:
+            jobs: Lista de execuções independentes
+            workers: Sobrescreve o número de processos do construtor
+            fn: Função de módulo que executa um job (padrão: _execute_run)
+        """
+        return list(self._dispatch_iter(jobs, workers, fn))
+    
+    def _dispatch_iter(
+        self,
+        jobs: List[Tuple[AlgorithmBase, tuple, dict, str]],
+        workers: Optional[int] = None,
+        fn: Callable = _execute_run
+    ):
+        """
+        Como _dispatch, mas entrega cada resultado assim que ele e os
+        anteriores terminam (para gravar os registros durante a execução).
+        """
+        workers = self.workers if workers is None else workers
+        if workers is None or workers <= 1 or len(jobs) <= 1:
+            for job in jobs:
+                yield fn(*job)
+            return
+        
+        initializer = initargs = None
+        if self.pin_workers and hasattr(os, 'sched_setaffinity'):
+            cores = sorted(os.sched_getaffinity(0))
+            initializer = _pin_worker
+            initargs = (multiprocessing.Value('i', 0), cores)
+        
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs)),
+            initializer=initializer,
+            initargs=initargs or ()
+        ) as executor:
+            yield from executor.map(fn, *zip(*jobs))
+    
+    def _dispatch_with_timeout(
+        self,
+        jobs: List[Tuple[AlgorithmBase, tuple, dict, str]],
+        timeout: float,
+        workers: Optional[int] = None,
+        fn: Callable = _execute_run
+    ) -> List[Any]:
+        """
+        Executa cada repetição num processo próprio, encerrado junto com os
+        processos que criar se passar de `timeout` segundos. Até `workers`
+        processos rodam ao mesmo tempo e a ordem de `jobs` é preservada.
+        
+        Quando uma repetição estoura o limite, as repetições ainda não
+        iniciadas do mesmo algoritmo são descartadas.
+        
+        Returns:
+            Para cada job, o retorno de `fn`, None (estourou o limite)
+            ou _SKIPPED (descartado)
+        """
+        return list(self._dispatch_with_timeout_iter(jobs, timeout, workers, fn))
+    
+    def _dispatch_with_timeout_iter(
+        self,
+        jobs: List[Tuple[AlgorithmBase, tuple, dict, str]],
+        timeout: float,
+        workers: Optional[int] = None,
+        fn: Callable = _execute_run
+    ):
+        """
+        Como _dispatch_with_timeout, mas entrega cada saída assim que ela e
+        as anteriores estão definidas (para gravar os registros durante a
+        execução). Fechar o gerador encerra os processos em andamento.
+        """
+        workers = self.workers if workers is None else workers
+        slots = max(1, workers or 1)
+        cores = None
+        if self.pin_workers and hasattr(os, 'sched_setaffinity'):
+            cores = sorted(os.sched_getaffinity(0))
+        
+        outputs = [_SKIPPED] * len(jobs)
+        finished = [False] * len(jobs)
+        pending = list(range(len(jobs)))
+        running = {}  # índice -> (processo, pipe, prazo, slot)
+        timed_out = set()
+        delivered = 0
+        
+        try:
+            while pending or running:
+                free = [slot for slot in range(slots) if slot not in {r[3] for r in running.values()}]
+                while pending and free:
+                    i = pending.pop(0)
+                    algorithm = jobs[i][0]
+                    if algorithm.name in timed_out:
+                        finished[i] = True
+                        continue
+                    slot = free.pop(0)
+                    recv, send = multiprocessing.Pipe(duplex=False)
+                    core = cores[slot % len(cores)] if cores else None
+                    process = multiprocessing.Process(
+                        target=_run_in_child,
+                        args=(send, fn, jobs[i], core)
+                    )
+                    process.start()
+                    send.close()
+                    running[i] = (process, recv, time.monotonic() + timeout, slot)
+                
+                if running:
+                    next_deadline = min(r[2] for r in running.values())
+                    ready = wait([r[1] for r in running.values()], max(0.0, next_deadline - time.monotonic()))
+                    now = time.monotonic()
+                    
+                    for i, (process, recv, deadline, _) in list(running.items()):
+                        if recv in ready:
+                            try:
+                                status, payload = recv.recv()
+                            except EOFError:
+                                status, payload = 'error', f"processo terminou com código {process.exitcode}"
+                            process.join()
+                            recv.close()
+                            del running[i]
+                            if status == 'error':
+                                raise RuntimeError(f"{jobs[i][0].name} falhou: {payload}")
+                            outputs[i] = payload
+                            finished[i] = True
+                        elif now >= deadline:
+                            _kill_child(process)
+                            recv.close()
+                            del running[i]
+                            outputs[i] = None
+                            finished[i] = True
+                            timed_out.add(jobs[i][0].name)
+                
+                while delivered < len(jobs) and finished[delivered]:
+                    yield outputs[delivered]
+                    delivered += 1
+        finally:
+            # Erro, interrupção ou gerador fechado: nenhum filho (nem seus workers) sobrevive
+            for process, recv, *_ in running.values():
+                _kill_child(process)
+                recv.close()
+    
+    @staticmethod
+    def _pass_modes(separate_counting: bool, memory_profile: Optional[str], rep: int) -> Tuple[str, Optional[str]]:
+        """
+        Modos (contagem, memória) do job: os passes de contagem e de memória
+        rodam só na primeira repetição de cada grupo.
+        """
+        if not separate_counting:
+            counting = COUNT_INLINE
+        else:
+            counting = COUNT_SEPARATE if rep == 0 else COUNT_OFF
+        return counting, (memory_profile if rep == 0 else None)
+    
+    @staticmethod
+    def _share_pass_metrics(shared: Dict, key: tuple, rep: int, result_data: Dict[str, Any], names: List[str]):
+        """Propaga as métricas dos passes da primeira repetição para as demais"""
+        metrics = result_data['metrics']
+        if rep == 0:
+            shared[key] = {name: metrics[name] for name in names if name in metrics}
+        elif key in shared:
+            metrics.update(shared[key])
+    
+    @staticmethod
+    def _memory_mode(memory_profile: bool, sample_rss: bool) -> Optional[str]:
+        if not memory_profile:
+            return None
+        return MEMORY_RSS if sample_rss else MEMORY_TRACED
+    
+    @staticmethod
+    def _shared_metric_names(separate_counting: bool, memory_profile: Optional[str]) -> List[str]:
+        names = ['operations_count'] if separate_counting else []
+        if memory_profile:
+            names += ['memory_usage', 'memory_rss_peak', 'memory_rss_delta']
+        return names
+    
+    def _profile_series(
+        self,
+        selected: Dict[tuple, Tuple[AlgorithmBase, tuple]],
+        label: str,
+        timeout: Optional[float],
+        workers: Optional[int]
+    ) -> Dict[tuple, Dict[str, str]]:
+        """
+        Passe de perfil de run_series: executa _profile_run para cada
+        (parâmetro, nome do algoritmo) de `selected`, mapeado para
+        (algoritmo, dataset).
+        
+        Returns:
+            Dict {(parâmetro, algoritmo): {'pstats': ..., 'collapsed': ...}},
+            com caminhos relativos a output_dir
+        """
+        profile_dir = self.output_dir / "profiles"
+        profile_dir.mkdir(exist_ok=True)
+        jobs = [
+            (algo, dataset, {}, str(profile_dir / f"{_slug(label)}_{_slug(name)}_{_slug(param)}"))
+            for (param, name), (algo, dataset) in selected.items()
+        ]
+        if timeout is None:
+            paths = self._dispatch(jobs, workers, _profile_run)
+        else:
+            paths = self._dispatch_with_timeout(jobs, timeout, workers, _profile_run)
+        
+        links = {}
+        for key, written in zip(selected, paths):
+            if written is None or written is _SKIPPED:
+                continue
+            links[key] = {kind: os.path.relpath(path, self.output_dir) for kind, path in written.items()}
+        print(f"🔬 Perfis salvos em: {profile_dir}")
+        return links
     
     def run_experiment(
         self,
         algorithms: List[AlgorithmBase],
         test_cases: List[Dict[str, Any]],
-        repetitions: int = 1
+        repetitions: int = 1,
+        workers: Optional[int] = None,
+        separate_counting: bool = True,
+        memory_profile: bool = False,
+        sample_rss: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Executa experimentos com múltiplos algoritmos e casos de teste.
@@ -40,35 +538,62 @@ class ExperimentRunner:
             algorithms: Lista de algoritmos a testar
             test_cases: Lista de casos de teste (dicts com args/kwargs)
             repetitions: Número de repetições para cada caso
+            workers: Processos para as repetições (padrão: o do construtor)
+            separate_counting: Se True, as operações são contadas num passe
+                               próprio (na primeira repetição) e os tempos
+                               são medidos com a contagem desligada
+            memory_profile: Se True, a primeira repetição faz um passe de
+                            memória (tracemalloc) e memory_usage recebe o
+                            pico em MB
+            sample_rss: Com memory_profile, também amostra o pico de RSS
             
         Returns:
             Lista com resultados de todos os experimentos
         """
         self.results = []
         
+        runs = []
         for test_case in test_cases:
             case_name = test_case.get('name', 'unnamed')
-            args = test_case.get('args', [])
+            args = tuple(test_case.get('args', []))
             kwargs = test_case.get('kwargs', {})
             
             for algorithm in algorithms:
                 for rep in range(repetitions):
-                    algorithm.reset_metrics()
-                    
-                    result_data = algorithm.run(*args, **kwargs)
-                    
-                    self.results.append({
-                        'experiment': self.name,
-                        'test_case': case_name,
-                        'algorithm': algorithm.name,
-                        'repetition': rep + 1,
-                        'result': result_data['result'],
-                        'metrics': result_data['metrics'],
-                        'timestamp': datetime.now().isoformat()
-                    })
+                    runs.append((case_name, algorithm, rep, args, kwargs))
+        
+        memory = self._memory_mode(memory_profile, sample_rss)
+        outputs = self._dispatch(
+            [(algorithm, args, kwargs, *self._pass_modes(separate_counting, memory, rep))
+             for _, algorithm, rep, args, kwargs in runs],
+            workers
+        )
+        
+        shared = {}
+        names = self._shared_metric_names(separate_counting, memory)
+        for (case_name, algorithm, rep, _, _), result_data in zip(runs, outputs):
+            self._share_pass_metrics(shared, (case_name, algorithm.name), rep, result_data, names)
+            self.results.append({
+                'experiment': self.name,
+                'test_case': case_name,
+                'algorithm': algorithm.name,
+                'repetition': rep + 1,
+                'result': result_data['result'],
+                'metrics': result_data['metrics'],
+                'timestamp': datetime.now().isoformat()
+            })
         
         return self.results
     
+    def _records(self):
+        """
+        Registros da última execução: self.results ou, se eles não foram
+        mantidos (keep_results=False), a leitura preguiçosa do JSONL.
+        """
+        if self.results or self.stream_path is None:
+            return self.results
+        return (_restore_parameter(r) for r in read_results(self.stream_path))
+    
     def save_results(self, filename: str = None):
         """
         Salva resultados em arquivo JSON.
@@ -88,6 +613,32 @@ class ExperimentRunner:
         print(f"Resultados salvos em: {filepath}")
         return filepath
     
+    def export_columnar(
+        self,
+        filename: str = None,
+        include_result: bool = False,
+        fmt: Optional[str] = None
+    ) -> Path:
+        """
+        Exporta os resultados da última execução em formato colunar (ver
+        core.columnar): Parquet se pyarrow estiver disponível, senão .npz
+        sem compressão. core.columnar.load_columnar lê o arquivo de volta
+        com as colunas numéricas em memory-map.
+        
+        Args:
+            filename: Nome do arquivo, sem extensão (padrão: nome do experimento)
+            include_result: Inclui o 'result' de cada execução (texto JSON)
+            fmt: columnar.PARQUET ou columnar.NPZ (padrão: automático)
+            
+        Returns:
+            Caminho do arquivo gravado
+        """
+        filepath = columnar.export_columnar(
+            self._records(), self.output_dir / (filename or self.name), include_result, fmt
+        )
+        print(f"Resultados colunares salvos em: {filepath}")
+        return filepath
+    
     def get_summary(self) -> Dict[str, Any]:
         """
         Retorna um resumo dos resultados do experimento.
@@ -118,6 +669,74 @@ class ExperimentRunner:
         summary['algorithm_stats'] = algo_stats
         
         return summary
+
+    def get_speedup(self, baseline: Any) -> Dict[str, Dict[Any, float]]:
+        """
+        Calcula o speedup de cada parâmetro de uma série em relação ao
+        parâmetro de referência (ex.: número de processos, baseline=1).
+        
+        Args:
+            baseline: Valor do parâmetro usado como referência
+            
+        Returns:
+            Dict {algoritmo: {parâmetro: tempo_médio(baseline) / tempo_médio(parâmetro)}}
+        """
+        times = {}
+        for r in self._records():
+            if r.get('status') == TIMEOUT:
+                continue
+            key = (r['algorithm'], r['parameter'])
+            times.setdefault(key, []).append(r['metrics']['execution_time'])
+        
+        speedup = {}
+        for (algo, param), values in times.items():
+            base = times.get((algo, baseline))
+            if not base:
+                continue
+            avg = sum(values) / len(values)
+            speedup.setdefault(algo, {})[param] = (sum(base) / len(base)) / avg if avg > 0 else float('inf')
+        
+        return speedup
+    
+    def analyze_complexity(
+        self,
+        metric: str = 'execution_time',
+        size_fn: Optional[Callable] = None,
+        budget: Optional[float] = None,
+        models: Optional[List[str]] = None,
+        save: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Ajusta os resultados da última série aos modelos de crescimento de
+        core.complexity (n, n log n, n^2, nm, 2^n, 3^n).
+        
+        Args:
+            metric: Métrica ajustada (execution_time ou operations_count)
+            size_fn: Converte o parâmetro em n ou (n, m) (necessário para nm)
+            budget: Orçamento (unidade da métrica) para extrapolar o maior n
+                    (para tempos, core.complexity.DEFAULT_TIME_BUDGET)
+            models: Modelos candidatos (padrão: todos os aplicáveis)
+            save: Se True, salva a análise em {name}_complexity.json
+            
+        Returns:
+            Dict {algoritmo: ajuste}, ver core.complexity.fit_complexity
+        """
+        analysis = analyze_results(self._records(), metric, size_fn, budget, models)
+        
+        for algo, fit in analysis.items():
+            line = (f"📈 {algo}: melhor ajuste O({fit['best']}), "
+                    f"expoente {fit['exponent']:.2f}, base {fit['growth_base']:.2f}")
+            if budget is not None:
+                line += f", maior n em {budget}: {fit['max_n_within_budget']}"
+            print(line)
+        
+        if save:
+            filepath = self.output_dir / f"{self.name}_complexity.json"
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(analysis, f, indent=2, ensure_ascii=False)
+            print(f"Análise de complexidade salva em: {filepath}")
+        
+        return analysis
     
     def run_series(
         self,
@@ -127,7 +746,19 @@ class ExperimentRunner:
         label: str = "experiment",
         xlabel: str = "Input Size",
         repetitions: int = 3,
-        show_plot: bool = False
+        show_plot: bool = False,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        benchmark: bool = False,
+        warmup: int = 1,
+        min_time: float = 0.2,
+        separate_counting: bool = True,
+        memory_profile: bool = False,
+        sample_rss: bool = False,
+        profile: Union[bool, List[Any]] = False,
+        stream: Optional[str] = None,
+        resume: bool = False,
+        keep_results: bool = True
     ):
         """
         Executa uma série de experimentos variando um parâmetro.
@@ -140,45 +771,243 @@ class ExperimentRunner:
             xlabel: Rótulo do eixo X (parâmetro variado)
             repetitions: Número de repetições por configuração
             show_plot: Se True, exibe o gráfico interativo (padrão: False)
+            workers: Processos para as repetições (padrão: o do construtor).
+                     Os datasets são gerados no processo atual e os
+                     resultados mantêm a ordem da execução em série
+            timeout: Limite de tempo (s) de cada repetição. Cada execução
+                     roda num processo que é encerrado ao estourar o limite;
+                     o registro recebe status TIMEOUT e o algoritmo deixa
+                     de ser executado nos parâmetros seguintes
+            benchmark: Se True, cada (parâmetro, algoritmo) é medido como
+                       no timeit: `warmup` execuções descartadas, número de
+                       execuções por amostra calibrado até somar `min_time`
+                       e GC desligado durante a medição. Cada uma das
+                       `repetitions` amostras vira um registro, todos com
+                       'statistics' (mediana, IQR e IC 95% da mediana), e o
+                       gráfico mostra a mediana com a faixa do IC. Com
+                       timeout, o limite vale para a medição inteira
+            warmup: Execuções de aquecimento no modo benchmark
+            min_time: Tempo mínimo (s) de cada amostra no modo benchmark
+            separate_counting: Se True (padrão), cada (parâmetro, algoritmo)
+                               tem um passe de contagem de operações e os
+                               passes de tempo rodam com a contagem
+                               desligada (AlgorithmBase.set_counting); com
+                               timeout, o passe de contagem entra no limite
+            memory_profile: Se True, cada (parâmetro, algoritmo) tem um passe
+                            de memória com tracemalloc; memory_usage passa a
+                            ser o pico em MB e o gráfico {label}_memory.png é
+                            gerado por Visualizer.plot_memory_usage
+            sample_rss: Com memory_profile, uma thread também amostra o pico
+                        de RSS do processo (memory_rss_peak/memory_rss_delta)
+            profile: True, ou a lista de parâmetros a perfilar. Cada
+                     (parâmetro, algoritmo) selecionado que não estourou o
+                     limite ganha um passe sob cProfile e outro sob
+                     StackProbe, gravados em {output_dir}/profiles como
+                     .pstats e .collapsed (flamegraph); os registros
+                     recebem 'profile' com os caminhos relativos a output_dir
+                     (com `stream`, os caminhos vão para
+                     profiles/{label}_profiles.json). Só os pares executados
+                     nesta chamada são perfilados
+            stream: Arquivo JSONL (relativo a output_dir, se não for
+                    absoluto) onde cada registro é gravado numa linha assim
+                    que sua execução termina (ver core.result_sink). Substitui
+                    o JSON salvo no fim por save_results()
+            resume: Com `stream`, continua o arquivo existente: registros já
+                    gravados (algoritmo, parâmetro, repetição) não são
+                    executados de novo e entram nos gráficos e na análise
+            keep_results: Se False, os registros não ficam em self.results;
+                          get_speedup e analyze_complexity passam a ler o
+                          JSONL de `stream` sob demanda
         """
         import matplotlib.pyplot as plt
         
+        if not keep_results and stream is None:
+            raise ValueError("keep_results=False exige stream")
         self.results = []
+        self.stream_path = None
         
         # Estrutura para armazenar tempos por algoritmo
         algo_times = {algo.name: [] for algo in algorithms}
         
-        for param in param_values:
-            # Gerar dataset para este parâmetro
-            dataset = dataset_fn(param)
-            
-            for algo in algorithms:
-                times = []
-                
-                for rep in range(repetitions):
-                    algo.reset_metrics()
-                    
-                    # Executar algoritmo
-                    result_data = algo.run(*dataset)
-                    
-                    times.append(result_data['metrics']['execution_time'])
-                    
-                    self.results.append({
+        memory = self._memory_mode(memory_profile, sample_rss)
+        if benchmark:
+            # Um job por (parâmetro, algoritmo), que devolve todas as amostras
+            fn = partial(_execute_benchmark, repetitions=repetitions, warmup=warmup, min_time=min_time)
+            job_reps = [0]
+        else:
+            fn = _execute_run
+            job_reps = range(repetitions)
+        
+        sink = None
+        if stream is not None:
+            path = Path(stream)
+            if not path.is_absolute():
+                path = self.output_dir / path
+            sink = ResultSink(path, resume=resume)
+            self.stream_path = path
+        done = sink.completed if sink is not None else set()
+        
+        times = {}
+        statistics = {}
+        shared = {}
+        names = self._shared_metric_names(separate_counting, memory)
+        stopped = set()
+        timed_out = set()
+        to_profile = {}
+        
+        def collect(record):
+            # Atualiza tempos, estatísticas e a lista de resultados
+            key = (record['parameter'], record['algorithm'])
+            if record.get('status') == TIMEOUT:
+                times[key] = None
+                timed_out.add(key)
+            elif times.get(key, []) is not None:
+                times.setdefault(key, []).append(record['metrics']['execution_time'])
+            if 'statistics' in record:
+                statistics[key] = record['statistics']
+            if keep_results:
+                self.results.append(record)
+        
+        def emit(run, output):
+            # Monta os registros de um job, grava no stream e coleta
+            param, algo, rep, dataset = run
+            key = (param, algo.name)
+            if output is None:
+                records = [{
+                    'experiment': label,
+                    'parameter': param,
+                    'algorithm': algo.name,
+                    'repetition': rep + 1,
+                    'result': None,
+                    'metrics': {},
+                    'status': TIMEOUT,
+                    'timeout': timeout,
+                    'timestamp': datetime.now().isoformat()
+                }]
+            else:
+                if not benchmark:
+                    self._share_pass_metrics(shared, key, rep, output, names)
+                samples = output if benchmark else [output]
+                stats = summarize_samples([r['metrics']['execution_time'] for r in samples]) if benchmark else None
+                records = []
+                for k, result_data in enumerate(samples):
+                    record = {
                         'experiment': label,
                         'parameter': param,
                         'algorithm': algo.name,
-                        'repetition': rep + 1,
+                        'repetition': rep + k + 1,
                         'result': result_data['result'],
                         'metrics': result_data['metrics'],
                         'timestamp': datetime.now().isoformat()
-                    })
-                
-                # Média dos tempos
-                avg_time = sum(times) / len(times)
-                algo_times[algo.name].append(avg_time)
+                    }
+                    if benchmark:
+                        record['statistics'] = stats
+                    records.append(record)
+                if profile and (profile is True or param in profile):
+                    to_profile.setdefault(key, (algo, dataset))
+            
+            for record in records:
+                if sink is not None:
+                    if record_key(algo.name, param, record['repetition']) in done:
+                        continue
+                    sink.write(record)
+                collect(record)
+        
+        def pending(param, algo, rep):
+            reps = range(1, repetitions + 1) if benchmark else [rep + 1]
+            return any(record_key(algo.name, param, r) not in done for r in reps)
+        
+        def param_runs(param, algos):
+            jobs = [(algo, rep) for algo in algos for rep in job_reps if pending(param, algo, rep)]
+            if not jobs:
+                return []
+            # Gerar dataset para este parâmetro
+            dataset = tuple(dataset_fn(param))
+            return [(param, algo, rep, dataset) for algo, rep in jobs]
+        
+        try:
+            if sink is not None and done:
+                # Retomada: registros já gravados alimentam gráficos e passes compartilhados
+                for record in read_results(sink.path):
+                    record = _restore_parameter(record)
+                    collect(record)
+                    key = (record['parameter'], record['algorithm'])
+                    if record.get('status') == TIMEOUT:
+                        stopped.add(record['algorithm'])
+                    elif record['repetition'] == 1:
+                        metrics = record['metrics']
+                        shared[key] = {name: metrics[name] for name in names if name in metrics}
+                print(f"↩️  Retomando {sink.path}: {len(done)} registros já gravados")
+            
+            # Executar algoritmos
+            if timeout is None:
+                runs = [run for param in param_values for run in param_runs(param, algorithms)]
+                outputs = self._dispatch_iter(
+                    [(algo, dataset, {}, *self._pass_modes(separate_counting, memory, rep))
+                     for _, algo, rep, dataset in runs],
+                    workers, fn
+                )
+                for run, output in zip(runs, outputs):
+                    emit(run, output)
+            else:
+                for param in param_values:
+                    algos = [algo for algo in algorithms if algo.name not in stopped]
+                    if not algos:
+                        break
+                    batch = param_runs(param, algos)
+                    batch_outputs = self._dispatch_with_timeout_iter(
+                        [(algo, dataset, {}, *self._pass_modes(separate_counting, memory, rep))
+                         for _, algo, rep, dataset in batch],
+                        timeout, workers, fn
+                    )
+                    for run, output in zip(batch, batch_outputs):
+                        if output is _SKIPPED:
+                            continue
+                        if output is None and run[1].name not in stopped:
+                            stopped.add(run[1].name)
+                            print(f"⏱️  {run[1].name} excedeu {timeout}s com parâmetro {param}; "
+                                  f"valores seguintes ignorados")
+                        emit(run, output)
+        finally:
+            if sink is not None:
+                sink.close()
+        
+        # Média dos tempos (mediana no modo benchmark; NaN onde o algoritmo
+        # estourou o limite ou não rodou)
+        algo_bands = {algo.name: ([], []) for algo in algorithms}
+        for param in param_values:
+            for algo in algorithms:
+                key = (param, algo.name)
+                values = times.get(key)
+                if not values:
+                    algo_times[algo.name].append(math.nan)
+                    algo_bands[algo.name][0].append(math.nan)
+                    algo_bands[algo.name][1].append(math.nan)
+                elif benchmark:
+                    algo_times[algo.name].append(statistics[key]['median'])
+                    algo_bands[algo.name][0].append(statistics[key]['ci_low'])
+                    algo_bands[algo.name][1].append(statistics[key]['ci_high'])
+                else:
+                    algo_times[algo.name].append(sum(values) / len(values))
+        
+        selected = {key: job for key, job in to_profile.items() if key not in timed_out}
+        if selected:
+            links = self._profile_series(selected, label, timeout, workers)
+            for record in self.results:
+                link = links.get((record['parameter'], record['algorithm']))
+                if link:
+                    record['profile'] = link
+            if sink is not None and links:
+                index = self.output_dir / "profiles" / f"{_slug(label)}_profiles.json"
+                with open(index, 'w', encoding='utf-8') as f:
+                    json.dump([{'algorithm': name, 'parameter': param, **link}
+                               for (param, name), link in links.items()], f, indent=2, ensure_ascii=False)
         
         # Salvar resultados
-        self.save_results()
+        if sink is None:
+            self.save_results()
+        else:
+            print(f"Resultados gravados em: {sink.path} ({sink.written} novos registros)")
         
         # Plotar gráfico com estilo moderno
         import matplotlib
@@ -209,10 +1038,14 @@ class ExperimentRunner:
                    markeredgecolor='white',
                    markeredgewidth=2,
                    alpha=0.9)
+            if benchmark:
+                low, high = algo_bands[algo_name]
+                ax.fill_between(param_values, low, high, color=color, alpha=0.2,
+                                label=f'{algo_name} (IC 95%)')
         
         # Personalizar eixos e grid
         ax.set_xlabel(xlabel, fontsize=12, fontweight='bold', color='#2c3e50')
-        ax.set_ylabel('Tempo de Execução (s)', fontsize=12, fontweight='bold', color='#2c3e50')
+        ax.set_ylabel('Tempo de Execução - mediana (s)' if benchmark else 'Tempo de Execução (s)', fontsize=12, fontweight='bold', color='#2c3e50')
         ax.set_title(f'{label} - Comparação de Desempenho', 
                     fontsize=14, fontweight='bold', color='#2c3e50', pad=20)
         
@@ -249,4 +1082,15 @@ class ExperimentRunner:
         else:
             plt.close()
         
+        if memory_profile:
+            from .visualizer import Visualizer
+            Visualizer(output_dir=str(self.output_dir)).plot_memory_usage(
+                list(self._records()),
+                title=f'{label} - Pico de Memória',
+                save_as=f"{label}_memory.png",
+                xlabel=xlabel
+            )
+            if not show_plot:
+                plt.close('all')
+        
         return self.results
@@ -0,0 +1,49 @@
+"""
+Suporte à execução iterativa (pilha explícita) de algoritmos recursivos
+Decide quando trocar a recursão do Python por uma pilha explícita
+"""
+
+import sys
+from typing import Optional
+
+
+# Frames deixados livres para quem chamou o algoritmo (runner, pytest, etc.)
+RECURSION_MARGIN = 100
+
+
+def exceeds_recursion_limit(depth: int, margin: int = RECURSION_MARGIN) -> bool:
+    """
+    Indica se uma recursão com a profundidade dada estouraria o limite do
+    interpretador (RecursionError).
+
+    Args:
+        depth: Profundidade máxima esperada da recursão
+        margin: Frames reservados para a pilha de quem chama
+
+    Returns:
+        True se depth + margin passa de sys.getrecursionlimit()
+    """
+    return depth + margin > sys.getrecursionlimit()
+
+
+def use_iterative(option: Optional[bool], depth: int) -> bool:
+    """
+    Resolve a opção `iterative` dos algoritmos recursivos.
+
+    Os caminhos iterativos são laços escritos à mão para cada algoritmo, com
+    os frames da recursão guardados numa lista (pilha explícita). Eles não
+    dependem do limite de recursão e evitam o custo de uma chamada de método
+    por nó; um motor genérico (geradores ou callbacks por nó) custaria mais
+    por nó do que a própria recursão do CPython.
+
+    Args:
+        option: True força a pilha explícita, False força a recursão e
+                None escolhe automaticamente pela profundidade
+        depth: Profundidade máxima da recursão para esta entrada
+
+    Returns:
+        True se o caminho iterativo deve ser usado
+    """
+    if option is None:
+        return exceeds_recursion_limit(depth)
+    return option
@@ -6,9 +6,15 @@ Inclui contadores de operações, tempo de execução e uso de memória
 import time
 import psutil
 import os
-from typing import Optional, Dict, Any
+import threading
+import tracemalloc
+from typing import Optional, Dict, Any, List
 from functools import wraps
 
+import numpy as np
+
+from .algorithm_base import AlgorithmBase, Probe
+
 
 class Metrics:
     """
@@ -90,6 +96,165 @@ class Metrics:
         )
 
 
+class MemoryProfiler:
+    """
+    Mede o pico de memória de um trecho de código.
+    
+    Usa tracemalloc (pico de bytes alocados pelo Python dentro do trecho,
+    descontado o que já estava alocado na entrada). Opcionalmente, uma
+    thread amostra o RSS do processo a cada `interval` segundos e guarda o
+    maior valor, o que inclui memória fora do alocador do Python (ex.:
+    buffers do NumPy alocados em C).
+    
+    Usage:
+        with MemoryProfiler(sample_rss=True) as profiler:
+            algorithm.run(data)
+        profiler.get_results()
+    """
+    
+    def __init__(self, sample_rss: bool = False, interval: float = 0.001):
+        """
+        Args:
+            sample_rss: Se True, amostra o RSS numa thread durante o trecho
+            interval: Intervalo (s) entre amostras de RSS
+        """
+        self.sample_rss = sample_rss
+        self.interval = interval
+        self.peak_bytes = 0
+        self.rss_start = None
+        self.rss_peak = None
+        self._started_tracing = False
+        self._stop = threading.Event()
+        self._sampler = None
+    
+    def _sample(self):
+        process = psutil.Process(os.getpid())
+        while not self._stop.wait(self.interval):
+            rss = process.memory_info().rss
+            if rss > self.rss_peak:
+                self.rss_peak = rss
+    
+    def __enter__(self):
+        if self.sample_rss:
+            self.rss_start = self.rss_peak = psutil.Process(os.getpid()).memory_info().rss
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+        
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        _, peak = tracemalloc.get_traced_memory()
+        if self._started_tracing:
+            tracemalloc.stop()
+        self.peak_bytes = max(0, peak - self._baseline)
+        
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+            rss = psutil.Process(os.getpid()).memory_info().rss
+            self.rss_peak = max(self.rss_peak, rss)
+        return False
+    
+    def get_results(self) -> Dict[str, float]:
+        """Retorna os picos medidos em MB"""
+        results = {'traced_peak_mb': self.peak_bytes / 1024 / 1024}
+        if self.rss_start is not None:
+            results['rss_peak_mb'] = self.rss_peak / 1024 / 1024
+            results['rss_delta_mb'] = (self.rss_peak - self.rss_start) / 1024 / 1024
+        return results
+
+
+class MemoryProbe(Probe):
+    """
+    Sonda do pipeline de AlgorithmBase.run() que mede cada execução com um
+    MemoryProfiler e grava em algorithm.metrics memory_usage (pico do
+    tracemalloc, em MB) e, com sample_rss, memory_rss_peak e
+    memory_rss_delta.
+    
+    O tracemalloc deixa a execução mais lenta; use num passe separado do
+    passe de tempo.
+    
+    Usage:
+        algorithm.add_probe(MemoryProbe(sample_rss=True))
+        algorithm.run(data)['metrics']['memory_usage']
+    """
+    
+    METRICS = ('memory_usage', 'memory_rss_peak', 'memory_rss_delta')
+    
+    def __init__(self, sample_rss: bool = False, interval: float = 0.001):
+        self.sample_rss = sample_rss
+        self.interval = interval
+        self._profiler = None
+    
+    def before(self, algorithm: AlgorithmBase):
+        self._profiler = MemoryProfiler(sample_rss=self.sample_rss, interval=self.interval)
+        self._profiler.__enter__()
+    
+    def after(self, algorithm: AlgorithmBase):
+        # Solta o profiler (e sua thread) para o algoritmo continuar serializável
+        profiler, self._profiler = self._profiler, None
+        profiler.__exit__(None, None, None)
+        results = profiler.get_results()
+        algorithm.metrics['memory_usage'] = results['traced_peak_mb']
+        if self.sample_rss:
+            algorithm.metrics['memory_rss_peak'] = results['rss_peak_mb']
+            algorithm.metrics['memory_rss_delta'] = results['rss_delta_mb']
+
+
+def summarize_samples(
+    samples: List[float],
+    confidence: float = 0.95,
+    n_boot: int = 2000,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Estatísticas robustas de uma lista de tempos.
+    
+    O intervalo de confiança é o bootstrap percentil da mediana: reamostra
+    `samples` com reposição `n_boot` vezes e toma os quantis das medianas.
+    
+    Args:
+        samples: Tempos medidos (s)
+        confidence: Nível do intervalo de confiança
+        n_boot: Número de reamostragens do bootstrap
+        seed: Semente do gerador (resultados reprodutíveis)
+        
+    Returns:
+        Dict com n, median, mean, q1, q3, iqr, ci_low, ci_high e confidence
+    """
+    data = np.asarray(samples, dtype=float)
+    if data.size == 0:
+        raise ValueError("samples não pode ser vazio")
+    
+    q1, median, q3 = np.percentile(data, [25, 50, 75])
+    if data.size > 1:
+        rng = np.random.default_rng(seed)
+        boot = np.median(rng.choice(data, size=(n_boot, data.size), replace=True), axis=1)
+        alpha = (1 - confidence) / 2
+        ci_low, ci_high = np.quantile(boot, [alpha, 1 - alpha])
+    else:
+        ci_low = ci_high = median
+    
+    return {
+        'n': int(data.size),
+        'median': float(median),
+        'mean': float(data.mean()),
+        'q1': float(q1),
+        'q3': float(q3),
+        'iqr': float(q3 - q1),
+        'ci_low': float(ci_low),
+        'ci_high': float(ci_high),
+        'confidence': confidence
+    }
+
+
 def measure_performance(func):
     """
     Decorator para medir automaticamente o desempenho de uma função.
@@ -0,0 +1,94 @@
+"""
+Perfis de execução
+Sondas para o pipeline de AlgorithmBase.run() que gravam um perfil do
+cProfile (.pstats) ou as pilhas de chamadas no formato "collapsed" usado
+por flamegraph.pl / speedscope
+"""
+
+import cProfile
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Union
+
+from .algorithm_base import AlgorithmBase, Probe
+
+
+class CProfileProbe(Probe):
+    """
+    Perfila cada execução com cProfile e salva as estatísticas em `path`
+    (abrir com pstats.Stats(path) ou snakeviz).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._profiler = None
+
+    def before(self, algorithm: AlgorithmBase):
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def after(self, algorithm: AlgorithmBase):
+        profiler, self._profiler = self._profiler, None
+        profiler.disable()
+        profiler.dump_stats(str(self.path))
+
+
+class StackProbe(Probe):
+    """
+    Registra, via sys.setprofile, o tempo próprio de cada pilha de chamadas
+    (funções Python e funções C) e salva em `path` uma linha por pilha no
+    formato collapsed: "mod:func;mod:func;... microssegundos".
+
+    É um perfilador determinístico: toda chamada passa pelo gancho, então
+    os tempos absolutos ficam inflados, mas as proporções entre as pilhas
+    são as que importam no flamegraph. O tempo gasto no próprio gancho é
+    descontado. Não pode rodar junto com o cProfile (ambos usam o mesmo
+    gancho do interpretador).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.stacks: Dict[str, float] = {}
+        self._keys = []
+        self._last = 0.0
+
+    def _trace(self, frame, event, arg):
+        now = time.perf_counter()
+        keys = self._keys
+        if keys:
+            key = keys[-1]
+            self.stacks[key] = self.stacks.get(key, 0.0) + (now - self._last)
+
+        if event == 'call':
+            code = frame.f_code
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = f"{frame.f_globals.get('__name__', '?')}:{name}"
+            keys.append(f"{keys[-1]};{label}" if keys else label)
+        elif event == 'c_call' and keys:
+            # Na raiz só entram funções Python: o relógio do pipeline fica de fora
+            label = f"{getattr(arg, '__module__', None) or 'builtins'}:{getattr(arg, '__qualname__', repr(arg))}"
+            keys.append(f"{keys[-1]};{label}" if keys else label)
+        elif keys:
+            # return, c_return e c_exception fecham o quadro do topo
+            keys.pop()
+
+        self._last = time.perf_counter()
+
+    def before(self, algorithm: AlgorithmBase):
+        self.stacks = {}
+        self._keys = []
+        self._last = time.perf_counter()
+        sys.setprofile(self._trace)
+
+    def after(self, algorithm: AlgorithmBase):
+        sys.setprofile(None)
+        # As pilhas ainda abertas são a deste método
+        for key in self._keys:
+            self.stacks.pop(key, None)
+        self._keys = []
+        with open(self.path, 'w', encoding='utf-8') as f:
+            for key, seconds in sorted(self.stacks.items()):
+                micros = round(seconds * 1e6)
+                if micros > 0:
+                    f.write(f"{key} {micros}\n")
@@ -0,0 +1,174 @@
+"""
+Gravação incremental de resultados
+Cada registro vira uma linha JSON compacta (JSONL) assim que a execução
+termina, o que permite retomar uma varredura interrompida e ler os
+resultados sem carregá-los todos na memória
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Set, Tuple, Union
+
+Key = Tuple[str, str, int]
+
+
+def record_key(algorithm: str, parameter: Any, repetition: int) -> Key:
+    """
+    Chave (algoritmo, parâmetro, repetição) de um registro. O parâmetro é
+    normalizado como JSON, então uma tupla e a lista lida do arquivo têm a
+    mesma chave.
+    """
+    return algorithm, json.dumps(parameter, sort_keys=True), repetition
+
+
+def read_results(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Lê um arquivo JSONL registro a registro (preguiçosamente).
+
+    Uma última linha sem '\\n' é lida se for um JSON válido e ignorada se
+    estiver incompleta (execução interrompida no meio da escrita); linhas
+    inválidas no meio do arquivo geram ValueError.
+
+    Yields:
+        Dicts de registro, na ordem em que foram gravados
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.endswith('\n'):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    return
+                yield record
+                return
+            if line.strip():
+                yield json.loads(line)
+
+
+def completed_keys(path: Union[str, Path]) -> Set[Key]:
+    """Chaves (ver record_key) dos registros já gravados em `path`"""
+    if not os.path.exists(path):
+        return set()
+    return {
+        record_key(r['algorithm'], r.get('parameter', r.get('test_case')), r['repetition'])
+        for r in read_results(path)
+    }
+
+
+class ResultSink:
+    """
+    Escritor de registros em JSONL, uma linha compacta por registro.
+
+    Uma thread descarrega o buffer no disco a cada `flush_interval`
+    segundos sempre que há registros pendentes (e no fechamento), então
+    uma falha perde no máximo esse intervalo, mesmo que nenhum registro
+    novo chegue. Ao abrir para continuar um arquivo, uma última linha
+    incompleta é descartada, com o mesmo critério de read_results.
+
+    Usage:
+        with ResultSink("results/logs/serie.jsonl", resume=True) as sink:
+            if ('Algo', '10', 1) not in sink.completed:
+                sink.write(record)
+    """
+
+    def __init__(self, path: Union[str, Path], resume: bool = False, flush_interval: float = 1.0):
+        """
+        Args:
+            path: Arquivo .jsonl
+            resume: Se True, acrescenta ao arquivo existente e carrega em
+                    `completed` as chaves já gravadas; se False, sobrescreve
+            flush_interval: Intervalo máximo (s) entre descargas no disco;
+                            0 descarrega a cada registro
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.completed: Set[Key] = set()
+        self.written = 0
+
+        if resume and self.path.exists():
+            self._repair_tail()
+            self.completed = completed_keys(self.path)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+
+        self._lock = threading.Lock()
+        self._pending = False
+        self._stop = threading.Event()
+        self._flusher = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+
+    def _repair_tail(self, chunk_size: int = 1 << 16):
+        """
+        Trata a última linha sem '\n' (cortada por uma falha): se ela é um
+        JSON válido, completa a linha; senão, trunca o arquivo no último
+        '\n'. Lê o arquivo de trás para frente em blocos, sem carregá-lo.
+        """
+        with open(self.path, 'rb+') as f:
+            pos = f.seek(0, os.SEEK_END)
+            tail = b''
+            start = 0
+            while pos > 0:
+                step = min(chunk_size, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                i = chunk.rfind(b'\n')
+                if i >= 0:
+                    start = pos + i + 1
+                    tail = chunk[i + 1:] + tail
+                    break
+                tail = chunk + tail
+            if not tail:
+                return
+            try:
+                json.loads(tail)
+            except ValueError:
+                f.truncate(start)
+            else:
+                f.seek(0, os.SEEK_END)
+                f.write(b'\n')
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def write(self, record: Dict[str, Any]):
+        """Acrescenta um registro (descarregado no disco pela thread ou já, com flush_interval=0)"""
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._pending = True
+        self.completed.add(record_key(
+            record['algorithm'], record.get('parameter', record.get('test_case')), record['repetition']
+        ))
+        self.written += 1
+        if self._flusher is None:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._pending and not self._file.closed:
+                self._file.flush()
+                self._pending = False
+
+    def close(self):
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -68,36 +68,59 @@ class Visualizer:
     def plot_complexity_analysis(
         self,
         results: List[Dict[str, Any]],
-        x_metric: str = 'input_size',
+        x_metric: str = 'parameter',
         y_metric: str = 'execution_time',
         title: str = "Análise de Complexidade",
-        save_as: Optional[str] = None
+        save_as: Optional[str] = None,
+        fits: Optional[Dict[str, Dict[str, Any]]] = None,
+        size_fn=None
     ):
         """
         Plota análise de complexidade (tempo vs tamanho da entrada).
         
         Args:
             results: Lista de resultados dos experimentos
-            x_metric: Métrica para o eixo X
+            x_metric: Métrica para o eixo X ('parameter' usa o parâmetro
+                      variado em run_series; outros nomes são lidos de metrics)
             y_metric: Métrica para o eixo Y
             title: Título do gráfico
             save_as: Nome do arquivo para salvar (opcional)
+            fits: Ajustes de ExperimentRunner.analyze_complexity; a curva do
+                  melhor modelo de cada algoritmo é sobreposta tracejada
+            size_fn: Converte o parâmetro em n ou (n, m), como na análise
         """
-        df = pd.DataFrame(results)
+        from .complexity import predict
+        
+        df = pd.DataFrame([r for r in results if r.get('status') is None])
         
         plt.figure(figsize=(12, 6))
         
         for algorithm in df['algorithm'].unique():
             algo_data = df[df['algorithm'] == algorithm]
             
-            x_values = algo_data['metrics'].apply(lambda m: m.get(x_metric, 0))
+            if x_metric == 'parameter':
+                x_values = algo_data['parameter']
+            else:
+                x_values = algo_data['metrics'].apply(lambda m: m.get(x_metric, 0))
             y_values = algo_data['metrics'].apply(lambda m: m.get(y_metric, 0))
             
-            plt.plot(x_values, y_values, marker='o', label=algorithm)
+            # Mediana das repetições de cada ponto
+            points = pd.DataFrame({'x': x_values, 'y': y_values}).groupby('x')['y'].median()
+            line, = plt.plot(points.index, points.values, marker='o', label=algorithm)
+            
+            fit = (fits or {}).get(algorithm)
+            if fit is not None and x_metric == 'parameter':
+                sizes = [size_fn(x) if size_fn else x for x in points.index]
+                n_values = [s[0] if isinstance(s, (tuple, list)) else s for s in sizes]
+                plt.plot(points.index, [predict(fit, n) for n in n_values],
+                         linestyle='--', color=line.get_color(), alpha=0.7,
+                         label=f"{algorithm} ~ O({fit['best']})")
         
         plt.title(title)
         plt.xlabel(x_metric.replace('_', ' ').title())
         plt.ylabel(y_metric.replace('_', ' ').title())
+        if fits:
+            plt.yscale('log')
         plt.legend()
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
@@ -153,26 +176,47 @@ class Visualizer:
         self,
         results: List[Dict[str, Any]],
         title: str = "Uso de Memória",
-        save_as: Optional[str] = None
+        save_as: Optional[str] = None,
+        xlabel: str = "Parâmetro"
     ):
         """
         Plota comparação de uso de memória.
         
+        Registros de run_series (com 'parameter') viram uma curva por
+        algoritmo com a mediana de memory_usage em cada parâmetro; sem
+        parâmetro, mostra a distribuição por algoritmo (boxplot). Se os
+        registros têm memory_rss_delta, o crescimento do RSS aparece tracejado.
+        
         Args:
             results: Lista de resultados dos experimentos
             title: Título do gráfico
             save_as: Nome do arquivo para salvar (opcional)
+            xlabel: Rótulo do eixo X quando há parâmetro
         """
-        df = pd.DataFrame(results)
+        df = pd.DataFrame([r for r in results if r.get('status') is None])
         df['memory_usage'] = df['metrics'].apply(lambda x: x.get('memory_usage', 0))
         
         plt.figure(figsize=(12, 6))
-        sns.boxplot(data=df, x='algorithm', y='memory_usage')
+        
+        if 'parameter' in df:
+            df['memory_rss_delta'] = df['metrics'].apply(lambda x: x.get('memory_rss_delta'))
+            for algorithm in df['algorithm'].unique():
+                algo_data = df[df['algorithm'] == algorithm].groupby('parameter')
+                traced = algo_data['memory_usage'].median()
+                line, = plt.plot(traced.index, traced.values, marker='o', label=f"{algorithm} (tracemalloc)")
+                rss = algo_data['memory_rss_delta'].median().dropna()
+                if not rss.empty:
+                    plt.plot(rss.index, rss.values, linestyle='--', color=line.get_color(),
+                             alpha=0.7, label=f"{algorithm} (Δ RSS)")
+            plt.xlabel(xlabel)
+            plt.legend()
+        else:
+            sns.boxplot(data=df, x='algorithm', y='memory_usage')
+            plt.xlabel('Algoritmo')
+            plt.xticks(rotation=45, ha='right')
         
         plt.title(title)
-        plt.xlabel('Algoritmo')
         plt.ylabel('Uso de Memória (MB)')
-        plt.xticks(rotation=45, ha='right')
         plt.tight_layout()
         
         if save_as:
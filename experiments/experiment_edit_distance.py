@@ -10,8 +10,13 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from paradigms.divide_and_conquer.edit_distance_dc import EditDistance_DC
+from paradigms.divide_and_conquer.edit_distance_hirschberg import EditDistance_Hirschberg
 from paradigms.dynamic_programming.edit_distance_dp import EditDistance_DP
-from core.experiment_runner import ExperimentRunner
+from paradigms.dynamic_programming.edit_distance_bitparallel import EditDistance_BitParallel
+from paradigms.dynamic_programming.edit_distance_numpy import EditDistance_NumPy
+from core.complexity import DEFAULT_TIME_BUDGET
+from core.experiment_runner import ExperimentRunner, RUN_TIMEOUT
+from core.visualizer import Visualizer
 from datasets.generators import DataGenerator
 from utils.logger import get_logger
 
@@ -23,15 +28,46 @@ def dataset(n: int):
     log.info(f"Instâncias para n={n}: {s1} | {s2}")
     return (s1, s2)
 
-def main():
+def large_dataset(n: int):
+    DataGenerator.set_seed(42)
+    s1, s2 = DataGenerator.generate_similar_strings(n, similarity=0.8)
+    log.info(f"Instâncias para n={n} geradas ({len(s1)} x {len(s2)} caracteres)")
+    return (s1, s2)
+
+def main_large():
+    """Compara a PD em Python puro com a versão vetorizada em NumPy para strings longas"""
+    outdir = os.path.join("results", "edit_distance")
+    os.makedirs(outdir, exist_ok=True)
+    runner = ExperimentRunner(name="EditDistance_Large", output_dir=outdir)
+    algos = [EditDistance_DP(mode="rolling"), EditDistance_NumPy()]
+    n_values = [1000, 2000, 5000, 10000, 20000]
+    log.info("Iniciando experimento Edit Distance (strings longas)...")
+    # Pico de memória: duas linhas em listas Python vs diagonais em arrays NumPy
+    # Uma repetição só: o passe de contagem separado dobraria o custo
+    runner.run_series(algos, large_dataset, n_values, label="EditDistance_Large",
+                      xlabel="n (comprimento das strings)", repetitions=1, separate_counting=False,
+                      memory_profile=True, sample_rss=True)
+    log.info("Experimento finalizado com sucesso!")
+
+def main(workers: int = None):
     outdir = os.path.join("results", "edit_distance")
     os.makedirs(outdir, exist_ok=True)
-    runner = ExperimentRunner(name="EditDistance", output_dir=outdir)
-    algos = [EditDistance_DC(), EditDistance_DP()]
-    n_values = [2, 4, 6, 8, 10]  # cuidado, DC explode depois de ~10
+    runner = ExperimentRunner(name="EditDistance", output_dir=outdir, workers=workers, pin_workers=True)
+    algos = [EditDistance_DC(), EditDistance_DP(), EditDistance_Hirschberg(), EditDistance_BitParallel()]
+    # DC explode depois de ~10: o limite por execução o retira da série
+    n_values = [2, 4, 6, 8, 10, 12, 14, 16, 20, 30, 50]
     log.info("Iniciando experimento Edit Distance...")
-    runner.run_series(algos, dataset, n_values, label="EditDistance", xlabel="n (comprimento das strings)")
+    # Modo benchmark: as versões PD rodam em microssegundos nos n pequenos
+    runner.run_series(algos, dataset, n_values, label="EditDistance", xlabel="n (comprimento das strings)",
+                      repetitions=5, timeout=RUN_TIMEOUT, benchmark=True, memory_profile=True)
+    fits = runner.analyze_complexity(budget=DEFAULT_TIME_BUDGET)
+    Visualizer(output_dir=outdir).plot_complexity_analysis(
+        runner.results, fits=fits, title="EditDistance - Análise de Complexidade", save_as="EditDistance_complexity.png"
+    )
     log.info("Experimento finalizado com sucesso!")
 
 if __name__ == "__main__":
-    main()
+    if "--large" in sys.argv:
+        main_large()
+    else:
+        main()
@@ -11,7 +11,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from paradigms.divide_and_conquer.lis_dc import LIS_DC
 from paradigms.dynamic_programming.lis_dp import LIS_DP
+from paradigms.dynamic_programming.lis_patience import LIS_Patience
+from core.complexity import DEFAULT_TIME_BUDGET
 from core.experiment_runner import ExperimentRunner
+from core.visualizer import Visualizer
 from datasets.generators import DataGenerator
 from utils.logger import get_logger
 
@@ -30,7 +33,73 @@ def dataset(n: int):
     return (arr,)
 
 
-def main():
+def large_dataset(n: int):
+    """
+    Igual a dataset(), mas sem registrar o vetor inteiro no log.
+    """
+    DataGenerator.set_seed(42)
+    arr = DataGenerator.generate_lis_instance(n)
+    log.info(f"Instância gerada para n={n} ({len(arr)} elementos)")
+    return (arr,)
+
+
+def main_large():
+    """
+    Executa o LIS O(n log n) em vetores grandes (até 10^6 elementos).
+    """
+    outdir = os.path.join("results", "lis")
+    os.makedirs(outdir, exist_ok=True)
+
+    runner = ExperimentRunner(name="LIS_Large", output_dir=outdir)
+
+    algos = [
+        LIS_Patience()
+    ]
+
+    n_values = [10**3, 10**4, 10**5, 10**6]
+
+    log.info("Iniciando experimento LIS (vetores grandes)...")
+    runner.run_series(
+        algorithms=algos,
+        dataset_fn=large_dataset,
+        param_values=n_values,
+        label="LIS_Large",
+        xlabel="Tamanho do vetor (n)",
+        repetitions=1
+    )
+
+    log.info("Experimento finalizado com sucesso!")
+
+
+def main_memo():
+    """
+    Compara a memoização top-down (LIS_DC memoizado) com a PD bottom-up.
+    """
+    outdir = os.path.join("results", "lis")
+    os.makedirs(outdir, exist_ok=True)
+
+    runner = ExperimentRunner(name="LIS_Memo", output_dir=outdir)
+
+    algos = [
+        LIS_DC(memoize=True),
+        LIS_DP()
+    ]
+
+    n_values = [100, 250, 500, 1000, 2000]
+
+    log.info("Iniciando experimento LIS (memoização vs PD)...")
+    runner.run_series(
+        algorithms=algos,
+        dataset_fn=large_dataset,
+        param_values=n_values,
+        label="LIS_Memo",
+        xlabel="Tamanho do vetor (n)"
+    )
+
+    log.info("Experimento finalizado com sucesso!")
+
+
+def main(workers: int = None):
     """
     Executa o experimento de comparação entre as versões DC e PD do LIS.
     """
@@ -39,12 +108,13 @@ def main():
     os.makedirs(outdir, exist_ok=True)
 
     # Inicializa o executor
-    runner = ExperimentRunner(name="LIS", output_dir=outdir)
+    runner = ExperimentRunner(name="LIS", output_dir=outdir, workers=workers, pin_workers=True)
 
     # Algoritmos
     algos = [
         LIS_DC(),
-        LIS_DP()
+        LIS_DP(),
+        LIS_Patience()
     ]
 
     # Tamanhos de entrada
@@ -57,11 +127,24 @@ def main():
         dataset_fn=dataset,
         param_values=n_values,
         label="LIS",
-        xlabel="Tamanho do vetor (n)"
+        xlabel="Tamanho do vetor (n)",
+        repetitions=7,
+        # Execuções abaixo de 1 ms: laço calibrado, mediana e IC 95%
+        benchmark=True,
+        memory_profile=True
     )
 
+    fits = runner.analyze_complexity(budget=DEFAULT_TIME_BUDGET)
+    Visualizer(output_dir=outdir).plot_complexity_analysis(
+        runner.results, fits=fits, title="LIS - Análise de Complexidade", save_as="LIS_complexity.png"
+    )
     log.info("Experimento finalizado com sucesso!")
 
 
 if __name__ == "__main__":
-    main()
+    if "--large" in sys.argv:
+        main_large()
+    elif "--memo" in sys.argv:
+        main_memo()
+    else:
+        main()
@@ -0,0 +1,72 @@
+"""
+Experimento: N-Queens
+Backtracking com bitmasks e simetria de espelho (modo contagem)
+"""
+
+import json
+import os
+import sys
+
+# Adicionar diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from paradigms.backtracking.n_queens_bt import NQueensBacktracking
+from core.complexity import DEFAULT_TIME_BUDGET
+from core.experiment_runner import ExperimentRunner
+from core.visualizer import Visualizer
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+def dataset(n: int):
+    log.info(f"Tabuleiro {n}x{n}")
+    return (n,)
+
+def main(workers: int = None):
+    outdir = os.path.join("results", "n_queens")
+    os.makedirs(outdir, exist_ok=True)
+    runner = ExperimentRunner(name="NQueens", output_dir=outdir, workers=workers, pin_workers=True)
+    # Modo contagem: N=16 tem ~14.7 milhões de soluções, inviável materializar
+    algos = [NQueensBacktracking(count_only=True)]
+    n_values = [4, 6, 8, 10, 12, 14, 16]
+    log.info("Iniciando experimento N-Queens...")
+    # Uma repetição só: o passe de contagem separado dobraria o custo
+    runner.run_series(algos, dataset, n_values, label="NQueens", xlabel="N (tamanho do tabuleiro)", repetitions=1,
+                      separate_counting=False)
+    fits = runner.analyze_complexity(budget=DEFAULT_TIME_BUDGET)
+    Visualizer(output_dir=outdir).plot_complexity_analysis(
+        runner.results, fits=fits, title="NQueens - Análise de Complexidade", save_as="NQueens_complexity.png"
+    )
+    log.info("Experimento finalizado com sucesso!")
+
+# Tabuleiro fixo da série paralela (N=14 leva alguns segundos em um processo)
+PARALLEL_N = 14
+
+def parallel_dataset(workers: int):
+    log.info(f"Tabuleiro {PARALLEL_N}x{PARALLEL_N} com {workers} processo(s)")
+    return (PARALLEL_N, workers)
+
+def main_parallel():
+    """Speedup da contagem em função do número de processos"""
+    outdir = os.path.join("results", "n_queens")
+    os.makedirs(outdir, exist_ok=True)
+    runner = ExperimentRunner(name="NQueensParallel", output_dir=outdir)
+    algos = [NQueensBacktracking(count_only=True)]
+    workers = sorted({1, 2, 4, os.cpu_count() or 1})
+    log.info(f"Iniciando experimento N-Queens paralelo (N={PARALLEL_N}, processos={workers})...")
+    runner.run_series(algos, parallel_dataset, workers, label="NQueensParallel", xlabel="Processos", repetitions=3)
+
+    speedup = runner.get_speedup(baseline=1)
+    for algo, values in speedup.items():
+        for w, s in values.items():
+            log.info(f"{algo}: {w} processo(s) -> speedup {s:.2f}x")
+    report = os.path.join(outdir, "NQueensParallel_speedup.json")
+    with open(report, 'w', encoding='utf-8') as f:
+        json.dump({'n': PARALLEL_N, 'cpu_count': os.cpu_count(), 'speedup': speedup}, f, indent=2, ensure_ascii=False)
+    log.info(f"Relatório de speedup salvo em: {report}")
+
+if __name__ == "__main__":
+    if "--parallel" in sys.argv:
+        main_parallel()
+    else:
+        main()
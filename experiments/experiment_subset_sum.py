@@ -10,8 +10,11 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from paradigms.divide_and_conquer.subset_sum_dc import SubsetSum_DC
+from paradigms.divide_and_conquer.subset_sum_mitm import SubsetSum_MITM
 from paradigms.dynamic_programming.subset_sum_dp import SubsetSum_DP
-from core.experiment_runner import ExperimentRunner
+from core.complexity import DEFAULT_TIME_BUDGET
+from core.experiment_runner import ExperimentRunner, RUN_TIMEOUT
+from core.visualizer import Visualizer
 from datasets.generators import DataGenerator
 from utils.logger import get_logger
 
@@ -25,16 +28,63 @@ def dataset(n: int):
     log.info(f"Instância para n={n}: {S} | Target={T} (impossível - pior caso)")
     return (S, T)
 
-def main():
+def large_dataset(n: int):
+    DataGenerator.set_seed(42)
+    # Valores até 10^5: o target (soma total + 1) fica na casa dos milhões
+    S, T = DataGenerator.generate_subset_sum_instance(n, max_val=10**5, worst_case=True)
+    log.info(f"Instância para n={n}: Target={T} (impossível - pior caso)")
+    return (S, T)
+
+def main_large():
+    """Subset Sum com targets na casa dos milhões, usando a PD em bitset"""
+    outdir = os.path.join("results", "subset_sum")
+    os.makedirs(outdir, exist_ok=True)
+    runner = ExperimentRunner(name="SubsetSum_Large", output_dir=outdir)
+    algos = [SubsetSum_DP(mode="bitset")]
+    n_values = [20, 40, 80, 160, 320]
+    log.info("Iniciando experimento Subset Sum (targets grandes)...")
+    runner.run_series(algos, large_dataset, n_values, label="SubsetSum_Large", xlabel="Tamanho do conjunto (n)")
+    log.info("Experimento finalizado com sucesso!")
+
+def huge_values_dataset(n: int):
+    DataGenerator.set_seed(42)
+    # Valores até 10^12: inviável para a PD (pseudo-polinomial em T)
+    S, T = DataGenerator.generate_subset_sum_instance(n, max_val=10**12, worst_case=True)
+    log.info(f"Instância para n={n}: Target={T} (impossível - pior caso)")
+    return (S, T)
+
+def main_mitm():
+    """Meet-in-the-middle em instâncias com n até 40 e valores até 10^12"""
+    outdir = os.path.join("results", "subset_sum")
+    os.makedirs(outdir, exist_ok=True)
+    runner = ExperimentRunner(name="SubsetSum_MITM", output_dir=outdir)
+    algos = [SubsetSum_MITM()]
+    n_values = [20, 24, 28, 32, 36, 40]
+    log.info("Iniciando experimento Subset Sum (meet-in-the-middle, valores grandes)...")
+    runner.run_series(algos, huge_values_dataset, n_values, label="SubsetSum_MITM",
+                      xlabel="Tamanho do conjunto (n)", repetitions=1)
+    log.info("Experimento finalizado com sucesso!")
+
+def main(workers: int = None):
     outdir = os.path.join("results", "subset_sum")
     os.makedirs(outdir, exist_ok=True)
-    runner = ExperimentRunner(name="SubsetSum", output_dir=outdir)
-    algos = [SubsetSum_DC(), SubsetSum_DP()]
-    # Aumentei até n=18 para mostrar crescimento exponencial do DC
-    n_values = [8, 10, 12, 14, 16, 18]
+    runner = ExperimentRunner(name="SubsetSum", output_dir=outdir, workers=workers, pin_workers=True)
+    algos = [SubsetSum_DC(), SubsetSum_DC(branch_and_bound=True), SubsetSum_DP(), SubsetSum_MITM()]
+    # Crescimento exponencial do DC: o limite por execução o retira da série
+    n_values = [8, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 30]
     log.info("Iniciando experimento Subset Sum (PIOR CASO - target impossível)...")
-    runner.run_series(algos, dataset, n_values, label="SubsetSum", xlabel="Tamanho do conjunto (n)")
+    runner.run_series(algos, dataset, n_values, label="SubsetSum", xlabel="Tamanho do conjunto (n)",
+                      timeout=RUN_TIMEOUT, memory_profile=True)
+    fits = runner.analyze_complexity(budget=DEFAULT_TIME_BUDGET)
+    Visualizer(output_dir=outdir).plot_complexity_analysis(
+        runner.results, fits=fits, title="SubsetSum - Análise de Complexidade", save_as="SubsetSum_complexity.png"
+    )
     log.info("Experimento finalizado com sucesso!")
 
 if __name__ == "__main__":
-    main()
+    if "--large" in sys.argv:
+        main_large()
+    elif "--mitm" in sys.argv:
+        main_mitm()
+    else:
+        main()
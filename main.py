@@ -4,6 +4,7 @@ Aplicação Prática de Programação Dinâmica
 Implementação e comparação de algoritmos usando diferentes paradigmas
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -26,36 +27,46 @@ def show_menu():
     print("4. Executar todos os experimentos")
     print("5. Visualizar resultados salvos")
     print("6. Sobre o projeto")
+    print("7. Experimento: N-Queens (Backtracking)")
     print("0. Sair")
     print()
 
 
-def run_lis_experiment():
+def run_lis_experiment(workers=None):
     """Executa experimento LIS"""
     from experiments.experiment_lis import main as lis_main
-    lis_main()
+    lis_main(workers)
 
 
-def run_edit_distance_experiment():
+def run_edit_distance_experiment(workers=None):
     """Executa experimento Edit Distance"""
     from experiments.experiment_edit_distance import main as edit_main
-    edit_main()
+    edit_main(workers)
 
 
-def run_subset_sum_experiment():
+def run_subset_sum_experiment(workers=None):
     """Executa experimento Subset Sum"""
     from experiments.experiment_subset_sum import main as subset_main
-    subset_main()
+    subset_main(workers)
+
+
+def run_n_queens_experiment(workers=None):
+    """Executa experimento N-Queens"""
+    from experiments.experiment_n_queens import main as n_queens_main
+    n_queens_main(workers)
 
 
 def run_all_experiments():
-    """Executa todos os experimentos"""
-    print("\n🚀 Executando todos os experimentos...\n")
-    run_lis_experiment()
+    """Executa todos os experimentos, com as repetições distribuídas entre os núcleos"""
+    workers = os.cpu_count()
+    print(f"\n🚀 Executando todos os experimentos ({workers} processo(s))...\n")
+    run_lis_experiment(workers)
     print("\n" + "-" * 70 + "\n")
-    run_edit_distance_experiment()
+    run_edit_distance_experiment(workers)
     print("\n" + "-" * 70 + "\n")
-    run_subset_sum_experiment()
+    run_subset_sum_experiment(workers)
+    print("\n" + "-" * 70 + "\n")
+    run_n_queens_experiment(workers)
 
 
 def show_results():
@@ -149,6 +160,9 @@ def main():
             elif choice == "6":
                 show_about()
             
+            elif choice == "7":
+                run_n_queens_experiment()
+            
             else:
                 print("\n❌ Opção inválida! Tente novamente.")
         
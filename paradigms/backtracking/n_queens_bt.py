@@ -1,29 +1,252 @@
 """
 N-Queens Problem - Backtracking
-TODO: Implementar N-Queens usando Backtracking
+Busca com bitmasks para colunas e diagonais e simetria de espelho na primeira linha
 """
 
+from concurrent.futures import ProcessPoolExecutor
+
 from core.algorithm_base import AlgorithmBase
 
 
+def _first_row_branches(n):
+    """
+    Ramos da primeira linha com seus pesos pela simetria de espelho: cada
+    coluna da metade esquerda vale por ela e pela espelhada (peso 2); a
+    coluna central de n ímpar é o próprio espelho (peso 1).
+
+    Returns:
+        Lista de (coluna, peso)
+    """
+    branches = [(col, 2) for col in range(n // 2)]
+    if n % 2 == 1:
+        branches.append((n // 2, 1))
+    return branches
+
+
+def _count_subtree(full, cols, ld, rd):
+    """
+    Conta as soluções abaixo de um estado parcial.
+
+    Args:
+        full: Máscara com os n bits do tabuleiro ligados
+        cols: Colunas ocupadas
+        ld: Casas atacadas pelas diagonais descendo para a esquerda na próxima linha
+        rd: Casas atacadas pelas diagonais descendo para a direita na próxima linha
+
+    Returns:
+        Tupla (soluções, nós visitados)
+    """
+    nodes = 0
+
+    def place(cols, ld, rd):
+        nonlocal nodes
+        nodes += 1
+        total = 0
+        avail = full & ~(cols | ld | rd)
+        while avail:
+            bit = avail & -avail
+            avail ^= bit
+            next_cols = cols | bit
+            if next_cols == full:
+                total += 1  # última linha: solução sem nova chamada
+            else:
+                total += place(next_cols, ((ld | bit) << 1) & full, (rd | bit) >> 1)
+        return total
+
+    if cols == full:
+        return 1, 1
+    return place(cols, ld, rd), nodes
+
+
+def _iter_subtree(full, cols, ld, rd, prefix, nodes):
+    """
+    Gera (preguiçosamente) as soluções abaixo de um estado parcial.
+
+    Args:
+        prefix: Colunas das rainhas já posicionadas, linha a linha
+        nodes: Lista de um elemento onde os nós visitados são somados, com a
+            mesma contagem de _count_subtree (a última linha não gera nó)
+
+    Yields:
+        Listas com a coluna da rainha em cada linha
+    """
+    nodes[0] += 1
+    if cols == full:
+        yield list(prefix)
+        return
+    avail = full & ~(cols | ld | rd)
+    while avail:
+        bit = avail & -avail
+        avail ^= bit
+        next_cols = cols | bit
+        prefix.append(bit.bit_length() - 1)
+        if next_cols == full:
+            yield list(prefix)  # última linha: solução sem nova chamada
+        else:
+            yield from _iter_subtree(full, next_cols, ((ld | bit) << 1) & full, (rd | bit) >> 1, prefix, nodes)
+        prefix.pop()
+
+
+def _solutions_subtree(full, cols, ld, rd, prefix):
+    """
+    Lista as soluções abaixo de um estado parcial (tarefa de processo).
+
+    Returns:
+        Tupla (soluções, nós visitados)
+    """
+    nodes = [0]
+    solutions = list(_iter_subtree(full, cols, ld, rd, list(prefix), nodes))
+    return solutions, nodes[0]
+
+
+def _split_tasks(n):
+    """
+    Divide a árvore de busca pelas duas primeiras rainhas (só a primeira
+    se n == 1), respeitando a simetria da primeira linha.
+
+    Returns:
+        Lista de (peso, cols, ld, rd, prefixo) com um subproblema independente cada
+    """
+    full = (1 << n) - 1
+    tasks = []
+    for col, weight in _first_row_branches(n):
+        bit = 1 << col
+        cols, ld, rd = bit, (bit << 1) & full, bit >> 1
+        if cols == full:
+            tasks.append((weight, cols, ld, rd, [col]))
+            continue
+        avail = full & ~(cols | ld | rd)
+        while avail:
+            bit2 = avail & -avail
+            avail ^= bit2
+            tasks.append((
+                weight,
+                cols | bit2,
+                ((ld | bit2) << 1) & full,
+                (rd | bit2) >> 1,
+                [col, bit2.bit_length() - 1]
+            ))
+    return tasks
+
+
 class NQueensBacktracking(AlgorithmBase):
     """
     Implementação do problema das N-Rainhas usando Backtracking
     Complexidade: O(N!)
+
+    Colunas e diagonais ocupadas são inteiros usados como bitmasks, então as
+    casas livres de uma linha saem de uma única operação e cada candidata é
+    extraída com avail & -avail. A primeira rainha só percorre metade das
+    colunas; a outra metade é obtida por espelhamento.
+
+    Com workers > 1, as subárvores definidas pelas duas primeiras rainhas
+    são resolvidas em processos separados (ProcessPoolExecutor) e os
+    resultados são combinados na ordem das tarefas.
     """
-    
-    def __init__(self):
-        super().__init__("N-Queens - Backtracking")
-    
-    def solve(self, n):
+
+    def __init__(self, count_only: bool = False, workers: int = None):
+        """
+        Args:
+            count_only: Se True, solve() retorna apenas o número de soluções,
+                        sem materializar os tabuleiros
+            workers: Número de processos. None ou 1 executa no processo atual
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers deve ser positivo ou None")
+        self.count_only = count_only
+        self.workers = workers
+        name = "N-Queens - Backtracking (contagem)" if count_only else "N-Queens - Backtracking"
+        super().__init__(name)
+
+    def solve(self, n, workers: int = None):
         """
         Encontra todas as soluções para o problema das N-Rainhas.
-        
+
         Args:
             n: Número de rainhas (tamanho do tabuleiro)
-            
+            workers: Sobrescreve o número de processos definido no construtor
+
         Returns:
-            Lista de soluções (cada solução é uma lista de posições)
+            Lista de soluções (cada solução é uma lista de posições), ou o
+            número de soluções se count_only=True
+        """
+        if n < 1:
+            raise ValueError("n deve ser pelo menos 1")
+        workers = self.workers if workers is None else workers
+        if workers is not None and workers > 1:
+            return self._solve_parallel(n, workers)
+        if self.count_only:
+            return self.count_solutions(n)
+        return list(self.iter_solutions(n))
+
+    def count_solutions(self, n):
+        """Conta as soluções sem materializá-las"""
+        full = (1 << n) - 1
+        total = 0
+        for col, weight in _first_row_branches(n):
+            bit = 1 << col
+            count, nodes = _count_subtree(full, bit, (bit << 1) & full, bit >> 1)
+            self.count(nodes + 1)
+            total += weight * count
+        return total
+
+    def iter_solutions(self, n):
+        """
+        Gera as soluções uma a uma. Cada solução com a primeira rainha na
+        metade esquerda é seguida da sua espelhada.
+
+        Yields:
+            Listas com a coluna da rainha em cada linha
+        """
+        full = (1 << n) - 1
+        for col, weight in _first_row_branches(n):
+            bit = 1 << col
+            nodes = [1]  # o ramo da primeira linha, como em count_solutions
+            for solution in _iter_subtree(full, bit, (bit << 1) & full, bit >> 1, [col], nodes):
+                # Contabiliza antes de entregar, para o consumidor ver as métricas em dia
+                self.count(nodes[0])
+                nodes[0] = 0
+                yield solution
+                if weight == 2:
+                    yield [n - 1 - c for c in solution]
+            self.count(nodes[0])
+
+    def _solve_parallel(self, n, workers):
         """
-        # TODO: Implementar algoritmo
-        raise NotImplementedError("N-Queens Backtracking ainda não implementado")
+        Resolve as subárvores de _split_tasks em `workers` processos e
+        combina contagens (com os pesos da simetria) ou soluções (com as
+        espelhadas).
+        """
+        full = (1 << n) - 1
+        tasks = _split_tasks(n)
+        # Nós acima das tarefas, como na execução em série: o ramo de cada
+        # coluna da primeira linha e o estado após a primeira rainha (com
+        # n == 1 esse estado já é a própria tarefa)
+        self.count(len(_first_row_branches(n)) * (1 if n == 1 else 2))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            if self.count_only:
+                futures = [
+                    executor.submit(_count_subtree, full, cols, ld, rd)
+                    for _, cols, ld, rd, _ in tasks
+                ]
+                total = 0
+                for (weight, *_), future in zip(tasks, futures):
+                    count, nodes = future.result()
+                    self.count(nodes)
+                    total += weight * count
+                return total
+
+            futures = [
+                executor.submit(_solutions_subtree, full, cols, ld, rd, prefix)
+                for _, cols, ld, rd, prefix in tasks
+            ]
+            solutions = []
+            for (weight, *_), future in zip(tasks, futures):
+                subtree, nodes = future.result()
+                self.count(nodes)
+                for solution in subtree:
+                    solutions.append(solution)
+                    if weight == 2:
+                        solutions.append([n - 1 - c for c in solution])
+            return solutions
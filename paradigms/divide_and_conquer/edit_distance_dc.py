@@ -1,7 +1,14 @@
 from core.algorithm_base import AlgorithmBase
+from core.iterative import use_iterative
 
 class EditDistance_DC(AlgorithmBase):
-    def __init__(self):
+    def __init__(self, iterative: bool = None):
+        """
+        Args:
+            iterative: True usa pilha explícita, False usa recursão e None
+                escolhe pela profundidade (len(a) + len(b))
+        """
+        self.iterative = iterative
         super().__init__("Edit Distance (Divisão e Conquista)")
     
     def solve(self, a: str, b: str):
@@ -10,6 +17,8 @@ class EditDistance_DC(AlgorithmBase):
     
     def _edit_distance_algorithm(self, a: str, b: str) -> int:
         """Implementação do algoritmo Edit Distance usando D&C"""
+        if use_iterative(self.iterative, len(a) + len(b) + 1):
+            return self._dist_iterative(a, b)
         return self._dist(a, b)
 
     def _dist(self, a: str, b: str) -> int:
@@ -26,18 +35,45 @@ class EditDistance_DC(AlgorithmBase):
             self._dist(a[:-1], b[:-1]) + cost  # substituição ou match
         )
 
-    def run(self, a: str, b: str):
-        """Sobrescreve run para medir tempo corretamente"""
-        import time
-        start = time.perf_counter()
-        result = self._edit_distance_algorithm(a, b)
-        end = time.perf_counter()
-        
-        return {
-            'result': result,
-            'metrics': {
-                'execution_time': end - start,
-                'operations_count': self.metrics['operations_count'],
-                'memory_usage': 0
-            }
-        }
+    def _dist_iterative(self, a: str, b: str) -> int:
+        """
+        _dist com pilha explícita. Os prefixos são representados pelos
+        comprimentos (i, j) em vez de fatias das strings, e cada frame é
+        [i, j, estágio, melhor, custo]: os estágios 1, 2 e 3 recebem os
+        resultados de deleção, inserção e substituição, nessa ordem.
+        """
+        nodes = 0
+        stack = [[len(a), len(b), 0, 0, 0]]
+        ret = 0
+        while stack:
+            frame = stack[-1]
+            i, j, stage = frame[0], frame[1], frame[2]
+
+            if stage == 0:
+                nodes += 1
+                if i == 0:
+                    ret = j
+                    stack.pop()
+                elif j == 0:
+                    ret = i
+                    stack.pop()
+                else:
+                    frame[4] = 0 if a[i-1] == b[j-1] else 1
+                    frame[2] = 1
+                    stack.append([i - 1, j, 0, 0, 0])      # deleção
+            elif stage == 1:
+                frame[3] = ret + 1
+                frame[2] = 2
+                stack.append([i, j - 1, 0, 0, 0])          # inserção
+            elif stage == 2:
+                if ret + 1 < frame[3]:
+                    frame[3] = ret + 1
+                frame[2] = 3
+                stack.append([i - 1, j - 1, 0, 0, 0])      # substituição ou match
+            else:
+                cand = ret + frame[4]
+                ret = cand if cand < frame[3] else frame[3]
+                stack.pop()
+
+        self.count(nodes)
+        return ret
@@ -0,0 +1,108 @@
+"""
+Edit Distance com alinhamento - Hirschberg (Divisão e Conquista)
+Reconstrói o script de edição completo usando memória O(n + m)
+"""
+
+import sys
+
+from core.algorithm_base import AlgorithmBase
+
+
+class EditDistance_Hirschberg(AlgorithmBase):
+    """
+    Algoritmo de Hirschberg para distância de edição com alinhamento.
+
+    Divide `a` ao meio, calcula com duas linhas a última linha da PD para a
+    metade esquerda (no sentido normal) e para a metade direita (com as
+    strings invertidas) e escolhe o ponto de corte em `b` que minimiza a soma.
+    Os dois subproblemas são resolvidos recursivamente.
+
+    Complexidade: O(n*m) de tempo, O(n + m) de memória.
+    """
+
+    def __init__(self):
+        super().__init__("Edit Distance (Hirschberg)")
+
+    def solve(self, a: str, b: str):
+        """Implementação usando solve() - chamado por run() da classe base"""
+        return self._edit_distance_algorithm(a, b)
+
+    def _edit_distance_algorithm(self, a: str, b: str):
+        """
+        Returns:
+            Dict com 'distance' e 'script', onde o script é uma lista de
+            operações (op, char_a, char_b) com op em
+            'match', 'sub', 'del' ou 'ins'
+        """
+        self._peak_bytes = 0
+        script = []
+        self._hirschberg(a, b, script)
+        self.metrics['memory_usage'] = self._peak_bytes / 1024 / 1024
+
+        distance = sum(1 for op, _, _ in script if op != 'match')
+        return {'distance': distance, 'script': script}
+
+    def _last_row(self, a: str, b: str):
+        """Última linha da PD de a contra b, mantendo apenas duas linhas"""
+        m = len(b)
+        prev = list(range(m + 1))
+        curr = [0] * (m + 1)
+        self._peak_bytes = max(self._peak_bytes, sys.getsizeof(prev) + sys.getsizeof(curr))
+
+        for i in range(1, len(a) + 1):
+            curr[0] = i
+            ai = a[i - 1]
+            for j in range(1, m + 1):
+                cost = 0 if ai == b[j - 1] else 1
+                curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost)
+            prev, curr = curr, prev
+
+        self.count(len(a) * (m + 1))
+        return prev
+
+    def _hirschberg(self, a: str, b: str, script: list):
+        self.count()
+        n, m = len(a), len(b)
+
+        if n == 0:
+            script.extend(('ins', None, c) for c in b)
+            return
+        if m == 0:
+            script.extend(('del', c, None) for c in a)
+            return
+        if n == 1:
+            self._align_single(a, b, script, a_is_single=True)
+            return
+        if m == 1:
+            self._align_single(b, a, script, a_is_single=False)
+            return
+
+        mid = n // 2
+        left = self._last_row(a[:mid], b)
+        right = self._last_row(a[mid:][::-1], b[::-1])
+
+        split = min(range(m + 1), key=lambda j: left[j] + right[m - j])
+
+        self._hirschberg(a[:mid], b[:split], script)
+        self._hirschberg(a[mid:], b[split:], script)
+
+    @staticmethod
+    def _align_single(c: str, other: str, script: list, a_is_single: bool):
+        """
+        Alinha um único caractere `c` contra `other`: casa com a primeira
+        ocorrência, se existir, senão substitui o primeiro caractere.
+        """
+        k = other.find(c)
+        match_op = 'match'
+        if k < 0:
+            k = 0
+            match_op = 'sub'
+
+        for idx, ch in enumerate(other):
+            if idx == k:
+                pair = (c, ch) if a_is_single else (ch, c)
+                script.append((match_op, pair[0], pair[1]))
+            elif a_is_single:
+                script.append(('ins', None, ch))
+            else:
+                script.append(('del', ch, None))
@@ -3,48 +3,194 @@ LIS (Longest Increasing Subsequence) - Divide and Conquer
 TODO: Implementar versão Divide and Conquer do LIS
 """
 
+from collections import OrderedDict
+
 from core.algorithm_base import AlgorithmBase
+from core.iterative import use_iterative
 
 class LIS_DC(AlgorithmBase):
-    def __init__(self):
-        super().__init__("LIS (Divisão e Conquista)")
+    def __init__(self, memoize: bool = False, cache_size: int = None, iterative: bool = None):
+        """
+        Args:
+            memoize: Se True, guarda lis_end(i) já calculados (top-down com memoização)
+            cache_size: Limite de entradas do cache (LRU). None = sem limite
+            iterative: True usa pilha explícita, False usa recursão e None
+                escolhe pela profundidade (len(arr))
+        """
+        if cache_size is not None and cache_size < 1:
+            raise ValueError("cache_size deve ser positivo ou None")
+        self.memoize = memoize
+        self.cache_size = cache_size
+        self.iterative = iterative
+        self._cache = OrderedDict()
+        self._hits = self._misses = 0
+        name = "LIS (Divisão e Conquista, memoizado)" if memoize else "LIS (Divisão e Conquista)"
+        super().__init__(name)
     
     def solve(self, arr):
         """Implementação usando solve() - chamado por run() da classe base"""
         return self._lis_algorithm(arr)
 
     def lis_end(self, arr, i):
-        self.count()
         if i == 0:
+            self.count()
             return 1
+        ops = 1 + i  # chamada + comparações do laço
         best = 1
         for j in range(i):
-            self.count()
             if arr[j] < arr[i]:
                 cand = self.lis_end(arr, j) + 1
-                self.count()
+                ops += 1
+                if cand > best:
+                    best = cand; ops += 1
+        self.count(ops)
+        return best
+
+    def lis_end_iterative(self, arr, i):
+        """
+        lis_end com pilha explícita: cada frame guarda (i, próximo j,
+        melhor até agora) e recebe o retorno do filho em `ret`.
+        """
+        ops = 1
+        stack = [[i, 0, 1]]
+        ret = None
+        while stack:
+            frame = stack[-1]
+            k, j, best = frame
+            if ret is not None:
+                # Retorno do filho arr[j]
+                cand = ret + 1
+                ops += 1
+                if cand > best:
+                    best = cand; ops += 1
+                j += 1
+                ret = None
+
+            child = None
+            while j < k:
+                ops += 1
+                if arr[j] < arr[k]:
+                    child = j
+                    break
+                j += 1
+
+            if child is not None:
+                frame[1] = j
+                frame[2] = best
+                ops += 1
+                stack.append([child, 0, 1])
+                continue
+
+            stack.pop()
+            ret = best
+
+        self.count(ops)
+        return ret
+
+    def _cache_get(self, i):
+        """
+        Consulta o cache, contabilizando acertos e faltas em contadores
+        próprios (gravados nas métricas uma vez, no fim de _lis_algorithm)
+        """
+        value = self._cache.get(i)
+        if value is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        if self.cache_size is not None:
+            self._cache.move_to_end(i)
+        return value
+
+    def _cache_put(self, i, value):
+        self._cache[i] = value
+        if self.cache_size is not None and len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def lis_end_memo(self, arr, i):
+        """lis_end(i) top-down com memoização"""
+        cached = self._cache_get(i)
+        if cached is not None:
+            return cached
+
+        ops = 1 + i  # chamada + comparações do laço
+        best = 1
+        for j in range(i):
+            if arr[j] < arr[i]:
+                cand = self.lis_end_memo(arr, j) + 1
+                ops += 1
                 if cand > best:
-                    best = cand; self.count()
+                    best = cand; ops += 1
+
+        self.count(ops)
+        self._cache_put(i, best)
         return best
 
+    def lis_end_memo_iterative(self, arr, i):
+        """
+        Mesma recursão de lis_end_memo, com a pilha explícita de
+        lis_end_iterative; filhos já no cache não geram frame.
+        """
+        cached = self._cache_get(i)
+        if cached is not None:
+            return cached
+
+        ops = 1
+        stack = [[i, 0, 1]]
+        ret = None
+        while stack:
+            frame = stack[-1]
+            k, j, best = frame
+            if ret is not None:
+                # Retorno do filho arr[j]
+                cand = ret + 1
+                ops += 1
+                if cand > best:
+                    best = cand; ops += 1
+                j += 1
+                ret = None
+
+            child = None
+            while j < k:
+                ops += 1
+                if arr[j] < arr[k]:
+                    value = self._cache_get(j)
+                    if value is None:
+                        child = j
+                        break
+                    cand = value + 1
+                    ops += 1
+                    if cand > best:
+                        best = cand; ops += 1
+                j += 1
+
+            if child is not None:
+                frame[1] = j
+                frame[2] = best
+                ops += 1
+                stack.append([child, 0, 1])
+                continue
+
+            stack.pop()
+            self._cache_put(k, best)
+            ret = best
+
+        self.count(ops)
+        return ret
+
     def _lis_algorithm(self, arr):
         """Implementação do algoritmo LIS usando Divisão e Conquista"""
         if not arr:
             return 0
-        return max(self.lis_end(arr, i) for i in range(len(arr)))
-
-    def run(self, arr):
-        """Sobrescreve run para medir tempo corretamente"""
-        import time
-        start = time.perf_counter()
-        result = self._lis_algorithm(arr)
-        end = time.perf_counter()
-        
-        return {
-            'result': result,
-            'metrics': {
-                'execution_time': end - start,
-                'operations_count': self.metrics['operations_count'],
-                'memory_usage': 0
-            }
-        }
+        iterative = use_iterative(self.iterative, len(arr))
+        if not self.memoize:
+            lis_end = self.lis_end_iterative if iterative else self.lis_end
+            return max(lis_end(arr, i) for i in range(len(arr)))
+
+        self._cache.clear()
+        self._hits = self._misses = 0
+        lis_end = self.lis_end_memo_iterative if iterative else self.lis_end_memo
+        best = max(lis_end(arr, i) for i in range(len(arr)))
+        self._cache.clear()
+        self.metrics['cache_hits'] = self._hits
+        self.metrics['cache_misses'] = self._misses
+        return best
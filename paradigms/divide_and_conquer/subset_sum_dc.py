@@ -1,8 +1,20 @@
 from core.algorithm_base import AlgorithmBase
+from core.iterative import use_iterative
 
 class SubsetSum_DC(AlgorithmBase):
-    def __init__(self):
-        super().__init__("Subset Sum (Backtracking)")
+    def __init__(self, branch_and_bound: bool = False, iterative: bool = None):
+        """
+        Args:
+            branch_and_bound: Se True, ordena S de forma decrescente, poda
+                ramos cuja soma restante não alcança o target e memoiza
+                estados (i, target) que já falharam. Supõe valores não negativos
+            iterative: True usa pilha explícita, False usa recursão e None
+                escolhe pela profundidade (len(S) + 1)
+        """
+        self.branch_and_bound = branch_and_bound
+        self.iterative = iterative
+        name = "Subset Sum (Branch and Bound)" if branch_and_bound else "Subset Sum (Backtracking)"
+        super().__init__(name)
     
     def solve(self, S, target):
         """Implementação usando solve() - chamado por run() da classe base"""
@@ -10,6 +22,10 @@ class SubsetSum_DC(AlgorithmBase):
     
     def _subset_sum_algorithm(self, S, target):
         """Implementação do algoritmo Subset Sum usando Backtracking/D&C"""
+        if self.branch_and_bound:
+            return self._subset_sum_bnb(S, target)
+        if use_iterative(self.iterative, len(S) + 1):
+            return self._bt_iterative(S, target)
         return self._bt(S, 0, target)
 
     def _bt(self, S, i, target):
@@ -21,18 +37,132 @@ class SubsetSum_DC(AlgorithmBase):
         # Escolhe ou não escolhe o elemento atual
         return self._bt(S, i + 1, target) or self._bt(S, i + 1, target - S[i])
 
-    def run(self, S, target):
-        """Sobrescreve run para medir tempo corretamente"""
-        import time
-        start = time.perf_counter()
-        result = self._subset_sum_algorithm(S, target)
-        end = time.perf_counter()
-        
-        return {
-            'result': result,
-            'metrics': {
-                'execution_time': end - start,
-                'operations_count': self.metrics['operations_count'],
-                'memory_usage': 0
-            }
-        }
+    def _bt_iterative(self, S, target):
+        """
+        _bt com pilha explícita de (i, target). O ramo "não escolhe" é
+        empilhado por último para ser explorado primeiro, na mesma ordem
+        da recursão; os nós são contados localmente e somados no fim.
+        """
+        n = len(S)
+        stack = [(0, target)]
+        push = stack.append
+        pop = stack.pop
+        nodes = 0
+        found = False
+        while stack:
+            i, t = pop()
+            nodes += 1
+            if t == 0:
+                found = True
+                break
+            if i == n or t < 0:
+                continue
+            push((i + 1, t - S[i]))
+            push((i + 1, t))
+        self.count(nodes)
+        return found
+
+    def _subset_sum_bnb(self, S, target):
+        """
+        Branch and bound sobre os valores em ordem decrescente.
+
+        suffix[i] é a soma de values[i:]; se ela não alcança o target, nenhum
+        subconjunto do resto alcança e o ramo é cortado. Estados (i, target)
+        que falharam ficam num conjunto para não serem explorados de novo.
+        As métricas nodes_visited e tree_size (2^(n+1) - 1 nós da árvore
+        completa) mostram quanto da árvore foi evitado.
+        """
+        values = sorted(S, reverse=True)
+        n = len(values)
+        suffix = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            suffix[i] = suffix[i + 1] + values[i]
+
+        self.metrics['tree_size'] = 2 ** (n + 1) - 1
+        failed = set()
+        stats = [0, 0, 0]  # nós visitados, ramos podados, memo hits
+        if use_iterative(self.iterative, n + 1):
+            found = self._bnb_iterative(values, suffix, failed, target, stats)
+        else:
+            found = self._bnb(values, suffix, failed, n, 0, target, stats)
+
+        nodes, pruned, memo_hits = stats
+        self.count(nodes)
+        self.metrics['nodes_visited'] = nodes
+        self.metrics['pruned_branches'] = pruned
+        self.metrics['memo_hits'] = memo_hits
+        return found
+
+    def _bnb(self, values, suffix, failed, n, i, target, stats):
+        # stats acumula [nós, podas, memo hits]; as métricas são gravadas uma vez no fim
+        stats[0] += 1
+        if target == 0:
+            return True
+        if i == n or target < 0:
+            return False
+        if suffix[i] < target:
+            stats[1] += 1
+            return False
+        if (i, target) in failed:
+            stats[2] += 1
+            return False
+
+        # Incluir primeiro: com valores decrescentes o target cai mais rápido
+        found = (
+            (values[i] <= target and self._bnb(values, suffix, failed, n, i + 1, target - values[i], stats))
+            or self._bnb(values, suffix, failed, n, i + 1, target, stats)
+        )
+        if not found:
+            failed.add((i, target))
+        return found
+
+    def _bnb_iterative(self, values, suffix, failed, target, stats):
+        """
+        _bnb com pilha explícita. Cada frame é [i, target, estágio]:
+        estágio 0 avalia as podas e desce no ramo "escolhe", estágio 1 recebe
+        esse resultado e desce no ramo "não escolhe", estágio 2 recebe o
+        segundo resultado e registra a falha.
+        """
+        n = len(values)
+        nodes = pruned = memo_hits = 0
+        stack = [[0, target, 0]]
+        ret = False
+        while stack:
+            frame = stack[-1]
+            i, t, stage = frame
+
+            if stage == 0:
+                nodes += 1
+                if t == 0:
+                    ret = True
+                elif i == n or t < 0:
+                    ret = False
+                elif suffix[i] < t:
+                    pruned += 1
+                    ret = False
+                elif (i, t) in failed:
+                    memo_hits += 1
+                    ret = False
+                else:
+                    frame[2] = 1
+                    if values[i] <= t:
+                        stack.append([i + 1, t - values[i], 0])
+                    else:
+                        ret = False
+                    continue
+                stack.pop()
+            elif stage == 1:
+                if ret:
+                    stack.pop()
+                else:
+                    frame[2] = 2
+                    stack.append([i + 1, t, 0])
+            else:
+                if not ret:
+                    failed.add((i, t))
+                stack.pop()
+
+        stats[0] += nodes
+        stats[1] += pruned
+        stats[2] += memo_hits
+        return ret
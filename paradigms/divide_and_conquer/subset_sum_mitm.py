@@ -0,0 +1,52 @@
+"""
+Subset Sum - Meet-in-the-Middle (Horowitz-Sahni)
+Custo O(2^(n/2)) independente do valor do target
+"""
+
+from core.algorithm_base import AlgorithmBase
+
+
+class SubsetSum_MITM(AlgorithmBase):
+    """
+    Divide S em duas metades, enumera as 2^(n/2) somas de cada uma, ordena
+    ambas e procura um par com soma igual ao target com dois ponteiros
+    (esquerda crescente, direita decrescente).
+
+    Complexidade: O(2^(n/2) * n) de tempo, O(2^(n/2)) de memória.
+    """
+
+    def __init__(self):
+        super().__init__("Subset Sum (Meet-in-the-Middle)")
+
+    def solve(self, S, target):
+        """Implementação usando solve() - chamado por run() da classe base"""
+        return self._subset_sum_algorithm(S, target)
+
+    def _half_sums(self, values):
+        """Todas as somas de subconjuntos de `values`, por duplicação"""
+        sums = [0]
+        for v in values:
+            self.count(len(sums))
+            sums += [x + v for x in sums]
+        return sums
+
+    def _subset_sum_algorithm(self, S, target):
+        """Implementação do algoritmo Subset Sum por meet-in-the-middle"""
+        mid = len(S) // 2
+        left = sorted(self._half_sums(S[:mid]))
+        right = sorted(self._half_sums(S[mid:]))
+
+        i, j = 0, len(right) - 1
+        steps = 0
+        while i < len(left) and j >= 0:
+            steps += 1
+            total = left[i] + right[j]
+            if total == target:
+                self.count(steps)
+                return True
+            if total < target:
+                i += 1
+            else:
+                j -= 1
+        self.count(steps)
+        return False
@@ -0,0 +1,207 @@
+"""
+Edit Distance (Levenshtein) - Bit-paralelo (Myers 1999 / Hyyrö)
+Simula a coluna da PD com vetores de bits, processando w células por operação
+"""
+
+import heapq
+
+from core.algorithm_base import AlgorithmBase
+
+
+class EditDistance_BitParallel(AlgorithmBase):
+    """
+    Distância de edição pelo algoritmo bit-paralelo de Myers.
+
+    A string menor (padrão) é codificada em máscaras de bits; cada caractere
+    da outra string (texto) atualiza os vetores de deltas verticais Pv/Mv
+    (+1/-1) de uma coluna inteira com poucas operações inteiras. Padrões
+    maiores que `word_size` são divididos em blocos, e o delta horizontal
+    da última linha de cada bloco é propagado para o bloco seguinte.
+
+    Complexidade: O(n * ceil(m / w)) de tempo, O(sigma * ceil(m / w)) de memória.
+    """
+
+    def __init__(self, word_size: int = 64):
+        """
+        Args:
+            word_size: Bits por bloco. Use None para um único bloco do
+                       tamanho do padrão (um só inteiro grande do Python)
+        """
+        if word_size is not None and word_size < 1:
+            raise ValueError("word_size deve ser positivo ou None")
+        self.word_size = word_size
+        super().__init__("Edit Distance (Bit-paralelo)")
+
+    def solve(self, a: str, b: str):
+        """Implementação usando solve() - chamado por run() da classe base"""
+        return self._edit_distance_algorithm(a, b)
+
+    def _edit_distance_algorithm(self, a: str, b: str) -> int:
+        """Implementação do algoritmo de Myers com blocos"""
+        if len(a) < len(b):
+            a, b = b, a
+        if not b:
+            return len(a)
+
+        peq, widths = self._build_peq(b)
+        return self._distance(peq, widths, a)
+
+    def _build_peq(self, pattern: str):
+        """
+        Pré-processa o padrão: para cada caractere, uma máscara por bloco
+        com o bit i ligado quando pattern[i] == caractere.
+
+        Returns:
+            Tupla (peq, widths) com o dicionário de máscaras e a largura
+            de cada bloco
+        """
+        m = len(pattern)
+        w = self.word_size or m
+        widths = [min(w, m - start) for start in range(0, m, w)]
+
+        peq = {}
+        for i, c in enumerate(pattern):
+            self.count()
+            masks = peq.get(c)
+            if masks is None:
+                masks = peq[c] = [0] * len(widths)
+            masks[i // w] |= 1 << (i % w)
+
+        return peq, widths
+
+    def solve_many(self, query: str, candidates, top_k: int = None, max_distance: int = None):
+        """
+        Compara uma consulta contra muitos candidatos, pré-processando as
+        máscaras da consulta uma única vez.
+
+        Args:
+            query: String de consulta (usada como padrão)
+            candidates: Sequência de strings candidatas
+            top_k: Se informado, retorna só os k candidatos mais próximos
+            max_distance: Se informado, descarta candidatos com distância maior
+
+        Returns:
+            Lista de tuplas (índice, distância). Sem filtros, todos os
+            candidatos na ordem de entrada; com top_k, ordenada por
+            (distância, índice)
+        """
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k deve ser positivo")
+
+        m = len(query)
+        peq, widths = self._build_peq(query) if query else (None, None)
+
+        if top_k is None:
+            matches = []
+            for idx, cand in enumerate(candidates):
+                dist = self._bounded_distance(peq, widths, m, cand, max_distance)
+                if max_distance is None or dist <= max_distance:
+                    matches.append((idx, dist))
+            return matches
+
+        # Heap com os k melhores até agora (max-heap via chave negativa);
+        # a pior distância do heap vira o limite de corte dos próximos.
+        heap = []
+        for idx, cand in enumerate(candidates):
+            bound = max_distance
+            if len(heap) == top_k:
+                worst = -heap[0][0]
+                bound = worst if bound is None else min(bound, worst)
+            dist = self._bounded_distance(peq, widths, m, cand, bound)
+            if bound is not None and dist > bound:
+                continue
+            entry = (-dist, -idx)
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        return sorted(((-i, -d) for d, i in heap), key=lambda t: (t[1], t[0]))
+
+    def run_many(self, query: str, candidates, top_k: int = None, max_distance: int = None):
+        """
+        Executa solve_many pelo pipeline de run() e acrescenta às métricas
+        o número de pares e a vazão em pares/segundo.
+        """
+        candidates = list(candidates)
+        run_data = self._instrumented(
+            self.solve_many, (query, candidates), {'top_k': top_k, 'max_distance': max_distance}
+        )
+
+        metrics = run_data['metrics']
+        elapsed = metrics['execution_time']
+        metrics['pairs'] = len(candidates)
+        metrics['pairs_per_second'] = len(candidates) / elapsed if elapsed > 0 else float('inf')
+        return run_data
+
+    def _bounded_distance(self, peq, widths, m: int, text: str, max_distance: int = None) -> int:
+        """Distância da consulta pré-processada até `text`, com corte opcional em max_distance"""
+        if max_distance is not None and abs(len(text) - m) > max_distance:
+            return max_distance + 1
+        if not m:
+            return len(text)
+        return self._distance(peq, widths, text, max_distance)
+
+    def _distance(self, peq, widths, text: str, max_distance: int = None) -> int:
+        """
+        Executa a varredura de Myers do texto contra o padrão pré-processado.
+
+        Com max_distance, interrompe e retorna max_distance + 1 assim que a
+        distância parcial, descontadas as colunas restantes, já passa do limite.
+        """
+        nblocks = len(widths)
+        masks = [(1 << wb) - 1 for wb in widths]
+        highs = [1 << (wb - 1) for wb in widths]
+        zeros = [0] * nblocks
+
+        pv = masks[:]
+        mv = [0] * nblocks
+        score = []
+        row = 0
+        for wb in widths:
+            row += wb
+            score.append(row)
+
+        remaining = len(text)
+        for c in text:
+            eqs = peq.get(c, zeros)
+            hin = 1  # D[0][j] = j: delta horizontal +1 na linha 0
+            for blk in range(nblocks):
+                mask = masks[blk]
+                high = highs[blk]
+                p = pv[blk]
+                mn = mv[blk]
+                eq = eqs[blk]
+
+                xv = eq | mn
+                if hin < 0:
+                    eq |= 1
+                xh = ((((eq & p) + p) & mask) ^ p) | eq
+                ph = mn | (mask & ~(xh | p))
+                mh = p & xh
+
+                hout = 0
+                if ph & high:
+                    hout = 1
+                elif mh & high:
+                    hout = -1
+
+                ph = (ph << 1) & mask
+                mh = (mh << 1) & mask
+                if hin < 0:
+                    mh |= 1
+                elif hin > 0:
+                    ph |= 1
+
+                pv[blk] = mh | (mask & ~(xv | ph))
+                mv[blk] = ph & xv
+                score[blk] += hout
+                hin = hout
+
+            remaining -= 1
+            if max_distance is not None and score[-1] - remaining > max_distance:
+                self.count(nblocks * (len(text) - remaining))
+                return max_distance + 1
+
+        self.count(nblocks * len(text))
+        return score[-1]
@@ -1,8 +1,33 @@
+import sys
+
 from core.algorithm_base import AlgorithmBase
 
 class EditDistance_DP(AlgorithmBase):
-    def __init__(self):
-        super().__init__("Edit Distance (PD)")
+    MODES = ("table", "rolling")
+
+    def __init__(self, mode: str = "table", max_distance: int = None):
+        """
+        Args:
+            mode: "table" preenche a matriz completa (n+1)x(m+1);
+                  "rolling" mantém apenas duas linhas de tamanho min(n,m)+1
+            max_distance: Limite k opcional. Quando informado, só a faixa
+                  diagonal de largura 2k+1 é calculada (Ukkonen) e o
+                  resultado é max_distance + 1 sempre que a distância
+                  excede k
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Modo inválido: {mode!r} (use um de {self.MODES})")
+        if max_distance is not None and max_distance < 0:
+            raise ValueError("max_distance deve ser não negativo")
+        self.mode = mode
+        self.max_distance = max_distance
+        if max_distance is not None:
+            name = f"Edit Distance (PD, banda k={max_distance})"
+        elif mode == "table":
+            name = "Edit Distance (PD)"
+        else:
+            name = "Edit Distance (PD, duas linhas)"
+        super().__init__(name)
     
     def solve(self, a: str, b: str):
         """Implementação usando solve() - chamado por run() da classe base"""
@@ -10,39 +35,114 @@ class EditDistance_DP(AlgorithmBase):
     
     def _edit_distance_algorithm(self, a: str, b: str) -> int:
         """Implementação do algoritmo Edit Distance usando DP"""
+        if self.max_distance is not None:
+            return self._edit_distance_banded(a, b, self.max_distance)
+        if self.mode == "rolling":
+            return self._edit_distance_rolling(a, b)
+
         n, m = len(a), len(b)
         dp = [[0]*(m+1) for _ in range(n+1)]
+        self.metrics['memory_usage'] = (
+            sys.getsizeof(dp) + sum(sys.getsizeof(row) for row in dp)
+        ) / 1024 / 1024
 
         for i in range(n+1):
-            dp[i][0] = i; self.count()
+            dp[i][0] = i
         for j in range(m+1):
-            dp[0][j] = j; self.count()
+            dp[0][j] = j
+        ops = n + m + 2
 
         for i in range(1, n+1):
-            self.count()
+            ops += 1 + 3*m  # linha + (célula, custo, mínimo) por coluna
             for j in range(1, m+1):
-                self.count()
-                cost = 0 if a[i-1] == b[j-1] else 1; self.count()
+                cost = 0 if a[i-1] == b[j-1] else 1
                 dp[i][j] = min(
                     dp[i-1][j] + 1,
                     dp[i][j-1] + 1,
                     dp[i-1][j-1] + cost
-                ); self.count()
+                )
 
+        self.count(ops)
         return dp[n][m]
 
-    def run(self, a: str, b: str):
-        """Sobrescreve run para medir tempo corretamente"""
-        import time
-        start = time.perf_counter()
-        result = self._edit_distance_algorithm(a, b)
-        end = time.perf_counter()
-        
-        return {
-            'result': result,
-            'metrics': {
-                'execution_time': end - start,
-                'operations_count': self.metrics['operations_count'],
-                'memory_usage': 0
-            }
-        }
+    def _edit_distance_rolling(self, a: str, b: str) -> int:
+        """
+        Mesma recorrência da versão em tabela, mas guardando só a linha
+        anterior e a atual. A string menor fica na dimensão interna, então
+        a memória é O(min(n, m)).
+        """
+        if len(b) > len(a):
+            a, b = b, a
+        n, m = len(a), len(b)
+
+        prev = list(range(m+1))
+        curr = [0] * (m+1)
+        self.metrics['memory_usage'] = (sys.getsizeof(prev) + sys.getsizeof(curr)) / 1024 / 1024
+        ops = m + 1
+
+        for i in range(1, n+1):
+            ops += 1 + 3*m
+            curr[0] = i
+            ai = a[i-1]
+            for j in range(1, m+1):
+                cost = 0 if ai == b[j-1] else 1
+                curr[j] = min(
+                    prev[j] + 1,
+                    curr[j-1] + 1,
+                    prev[j-1] + cost
+                )
+            prev, curr = curr, prev
+
+        self.count(ops)
+        return prev[m]
+
+    def _edit_distance_banded(self, a: str, b: str, k: int) -> int:
+        """
+        Versão limitada por k: só as células com |i - j| <= k podem ter
+        valor <= k, então cada linha calcula apenas essa faixa. Se todas as
+        células da faixa passam de k, nenhuma linha seguinte pode voltar a
+        ficar <= k e o cálculo é interrompido.
+
+        Returns:
+            A distância, ou k + 1 (sentinela) se ela for maior que k
+        """
+        if len(b) > len(a):
+            a, b = b, a
+        n, m = len(a), len(b)
+        limit = k + 1
+
+        self.count()
+        if n - m > k:
+            return limit
+
+        prev = [j if j <= k else limit for j in range(m+1)]
+        curr = [limit] * (m+1)
+        self.metrics['memory_usage'] = (sys.getsizeof(prev) + sys.getsizeof(curr)) / 1024 / 1024
+        ops = m + 1
+
+        for i in range(1, n+1):
+            lo = max(1, i - k)
+            hi = min(m, i + k)
+            ops += 1 + 3*max(0, hi - lo + 1)
+            curr[0] = i if i <= k else limit
+            if lo > 1:
+                curr[lo-1] = limit  # resto de duas linhas atrás, fora da faixa
+            ai = a[i-1]
+            row_min = curr[0]
+            for j in range(lo, hi+1):
+                cost = 0 if ai == b[j-1] else 1
+                value = min(
+                    prev[j] + 1,
+                    curr[j-1] + 1,
+                    prev[j-1] + cost
+                )
+                curr[j] = value
+                if value < row_min:
+                    row_min = value
+            if row_min > k:
+                self.count(ops)
+                return limit
+            prev, curr = curr, prev
+
+        self.count(ops)
+        return prev[m] if prev[m] <= k else limit
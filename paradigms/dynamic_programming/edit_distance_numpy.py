@@ -0,0 +1,65 @@
+"""
+Edit Distance (Levenshtein) - PD vetorizada com NumPy
+Percorre a matriz por antidiagonais, cujas células são independentes entre si
+"""
+
+import numpy as np
+
+from core.algorithm_base import AlgorithmBase
+
+
+class EditDistance_NumPy(AlgorithmBase):
+    """
+    Distância de edição varrendo antidiagonais (i + j = d) da PD.
+
+    Cada célula da diagonal d depende apenas das diagonais d-1 e d-2, então
+    a diagonal inteira é calculada com operações vetoriais sobre arrays
+    int32. São mantidas três diagonais indexadas por i, com a string menor
+    nessa dimensão.
+
+    Complexidade: O(n*m) de trabalho em n+m passos vetoriais, O(min(n, m)) de memória.
+    """
+
+    def __init__(self):
+        super().__init__("Edit Distance (PD, NumPy)")
+
+    def solve(self, a: str, b: str):
+        """Implementação usando solve() - chamado por run() da classe base"""
+        return self._edit_distance_algorithm(a, b)
+
+    def _edit_distance_algorithm(self, a: str, b: str) -> int:
+        """Implementação da PD por antidiagonais"""
+        if len(a) > len(b):
+            a, b = b, a
+        n, m = len(a), len(b)
+        if n == 0:
+            return m
+
+        a_codes = np.frombuffer(a.encode('utf-32-le'), dtype=np.uint32)
+        # b invertida: para i crescente na diagonal d, b[d-i-1] vira b_rev[m-d+i]
+        b_rev = np.frombuffer(b[::-1].encode('utf-32-le'), dtype=np.uint32)
+
+        prev2 = np.zeros(n + 1, dtype=np.int32)  # diagonal d-2
+        prev = np.zeros(n + 1, dtype=np.int32)   # diagonal d-1
+        curr = np.zeros(n + 1, dtype=np.int32)   # diagonal d
+        prev[0] = 1
+        prev[1] = 1  # d = 1: D[0][1] = D[1][0] = 1
+        self.metrics['memory_usage'] = (
+            prev2.nbytes + prev.nbytes + curr.nbytes + a_codes.nbytes + b_rev.nbytes
+        ) / 1024 / 1024
+
+        for d in range(2, n + m + 1):
+            lo = max(1, d - m)
+            hi = min(n, d - 1)
+            if lo <= hi:
+                self.count(hi - lo + 1)
+                cost = (a_codes[lo-1:hi] != b_rev[m-d+lo:m-d+hi+1]).astype(np.int32)
+                cell = np.minimum(prev[lo-1:hi], prev[lo:hi+1]) + 1
+                np.minimum(cell, prev2[lo-1:hi] + cost, out=curr[lo:hi+1])
+            if d <= m:
+                curr[0] = d
+            if d <= n:
+                curr[d] = d
+            prev2, prev, curr = prev, curr, prev2
+
+        return int(prev[n])
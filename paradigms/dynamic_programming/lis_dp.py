@@ -19,27 +19,12 @@ class LIS_DP(AlgorithmBase):
         if n == 0:
             return 0
         dp = [1] * n
+        ops = 0
         for i in range(n):
-            self.count()
+            ops += 1 + i
             for j in range(i):
-                self.count()
                 if arr[j] < arr[i]:
                     dp[i] = max(dp[i], dp[j] + 1)
-                    self.count()
+                    ops += 1
+        self.count(ops)
         return max(dp)
-
-    def run(self, arr):
-        """Sobrescreve run para medir tempo corretamente"""
-        import time
-        start = time.perf_counter()
-        result = self._lis_algorithm(arr)
-        end = time.perf_counter()
-        
-        return {
-            'result': result,
-            'metrics': {
-                'execution_time': end - start,
-                'operations_count': self.metrics['operations_count'],
-                'memory_usage': 0
-            }
-        }
@@ -0,0 +1,62 @@
+"""
+LIS (Longest Increasing Subsequence) - Patience sorting
+Versão O(n log n) com busca binária e reconstrução da subsequência
+"""
+
+from bisect import bisect_left
+
+from core.algorithm_base import AlgorithmBase
+
+
+class LIS_Patience(AlgorithmBase):
+    """
+    LIS por patience sorting.
+
+    tails[k] guarda o índice do menor final possível de uma subsequência
+    crescente de tamanho k+1; cada elemento encontra sua pilha por busca
+    binária. O predecessor de cada elemento (topo da pilha anterior no
+    momento da inserção) permite reconstruir uma LIS ao final.
+
+    Complexidade: O(n log n) de tempo, O(n) de memória.
+    """
+
+    def __init__(self):
+        super().__init__("LIS (Patience Sorting)")
+
+    def solve(self, arr):
+        """Implementação usando solve() - chamado por run() da classe base"""
+        return self._lis_algorithm(arr)
+
+    def _lis_algorithm(self, arr):
+        """
+        Returns:
+            Dict com 'length' e 'subsequence' (uma LIS estritamente crescente)
+        """
+        n = len(arr)
+        if n == 0:
+            return {'length': 0, 'subsequence': []}
+
+        tail_values = []   # valores finais de cada pilha (ordenados)
+        tail_indices = []  # índices correspondentes em arr
+        prev = [-1] * n
+
+        for i, x in enumerate(arr):
+            self.count()
+            k = bisect_left(tail_values, x)
+            if k == len(tail_values):
+                tail_values.append(x)
+                tail_indices.append(i)
+            else:
+                tail_values[k] = x
+                tail_indices[k] = i
+            if k > 0:
+                prev[i] = tail_indices[k - 1]
+
+        subsequence = []
+        i = tail_indices[-1]
+        while i != -1:
+            subsequence.append(arr[i])
+            i = prev[i]
+        subsequence.reverse()
+
+        return {'length': len(subsequence), 'subsequence': subsequence}
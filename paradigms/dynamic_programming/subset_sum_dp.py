@@ -1,8 +1,29 @@
+import sys
+from array import array
+
 from core.algorithm_base import AlgorithmBase
 
 class SubsetSum_DP(AlgorithmBase):
-    def __init__(self):
-        super().__init__("Subset Sum (PD)")
+    MODES = ("table", "bitset", "witness")
+
+    def __init__(self, mode: str = "table"):
+        """
+        Args:
+            mode: "table" preenche a matriz (n+1)x(T+1) de booleanos;
+                  "bitset" guarda as somas alcançáveis como bits de um único
+                  inteiro grande, atualizado com reach |= reach << s;
+                  "witness" usa um único vetor de T+1 posições e também
+                  devolve o subconjunto encontrado
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Modo inválido: {mode!r} (use um de {self.MODES})")
+        self.mode = mode
+        names = {
+            "table": "Subset Sum (PD)",
+            "bitset": "Subset Sum (PD, bitset)",
+            "witness": "Subset Sum (PD 1-D, com testemunha)",
+        }
+        super().__init__(names[mode])
     
     def solve(self, S, T):
         """Implementação usando solve() - chamado por run() da classe base"""
@@ -10,34 +31,86 @@ class SubsetSum_DP(AlgorithmBase):
     
     def _subset_sum_algorithm(self, S, T):
         """Implementação do algoritmo Subset Sum usando DP"""
+        if self.mode == "bitset":
+            return self._subset_sum_bitset(S, T)
+        if self.mode == "witness":
+            return self._subset_sum_witness(S, T)
+
         n = len(S)
         dp = [[False] * (T + 1) for _ in range(n + 1)]
+        self.metrics['memory_usage'] = (
+            sys.getsizeof(dp) + sum(sys.getsizeof(row) for row in dp)
+        ) / 1024 / 1024
 
         for i in range(n + 1):
             dp[i][0] = True
-            self.count()
+        ops = n + 1
 
         for i in range(1, n + 1):
-            self.count()
+            ops += 1 + 2 * T  # linha + (célula, transição) por soma
             for t in range(1, T + 1):
-                self.count()
                 dp[i][t] = dp[i - 1][t] or (t >= S[i - 1] and dp[i - 1][t - S[i - 1]])
-                self.count()
 
+        self.count(ops)
         return dp[n][T]
 
-    def run(self, S, T):
-        """Sobrescreve run para medir tempo corretamente"""
-        import time
-        start = time.perf_counter()
-        result = self._subset_sum_algorithm(S, T)
-        end = time.perf_counter()
-        
-        return {
-            'result': result,
-            'metrics': {
-                'execution_time': end - start,
-                'operations_count': self.metrics['operations_count'],
-                'memory_usage': 0
-            }
-        }
+    def _subset_sum_bitset(self, S, T):
+        """
+        O bit t de `reach` indica se a soma t é alcançável. Incluir s desloca
+        todas as somas de uma vez; a máscara descarta somas acima de T.
+        """
+        if T < 0:
+            return False
+
+        mask = (1 << (T + 1)) - 1
+        reach = 1  # soma 0 (subconjunto vazio)
+        self.count()
+
+        for s in S:
+            self.count()
+            reach |= (reach << s) & mask
+            if (reach >> T) & 1:
+                break
+
+        self.metrics['memory_usage'] = sys.getsizeof(reach) / 1024 / 1024
+        return bool((reach >> T) & 1)
+
+    def _subset_sum_witness(self, S, T):
+        """
+        PD em uma dimensão: last[t] é o índice do item que alcançou a soma t
+        pela primeira vez (-1 se inalcançável). Percorrer t de T até s faz
+        last[t - s] refletir apenas os itens anteriores, então cada item é
+        usado no máximo uma vez. Como last[t - S[i]] < i sempre que
+        last[t] = i, seguir a cadeia a partir de T reconstrói o subconjunto.
+
+        Returns:
+            Dict com 'found' e 'subset' (lista de valores, ou None)
+        """
+        if T < 0:
+            return {'found': False, 'subset': None}
+
+        last = array('i', [-1]) * (T + 1)
+        last[0] = len(S)  # soma 0 alcançável sem itens
+        self.metrics['memory_usage'] = (last.itemsize * len(last)) / 1024 / 1024
+
+        ops = 0
+        for i, s in enumerate(S):
+            ops += 1 + max(0, T - s + 1)
+            for t in range(T, s - 1, -1):
+                if last[t] < 0 and last[t - s] >= 0:
+                    last[t] = i
+            if last[T] >= 0:
+                break
+        self.count(ops)
+
+        if last[T] < 0:
+            return {'found': False, 'subset': None}
+
+        subset = []
+        t = T
+        while t > 0:
+            i = last[t]
+            subset.append(S[i])
+            t -= S[i]
+        subset.reverse()
+        return {'found': True, 'subset': subset}
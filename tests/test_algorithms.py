@@ -3,8 +3,23 @@ Tests for algorithms
 TODO: Implementar testes unitários
 """
 
+import random
+
 import pytest
-from core.algorithm_base import AlgorithmBase
+from core.algorithm_base import AlgorithmBase, Probe
+from core.metrics import MemoryProbe
+from paradigms.backtracking.n_queens_bt import NQueensBacktracking
+from paradigms.dynamic_programming.edit_distance_dp import EditDistance_DP
+from paradigms.dynamic_programming.edit_distance_bitparallel import EditDistance_BitParallel
+from paradigms.dynamic_programming.edit_distance_numpy import EditDistance_NumPy
+from paradigms.divide_and_conquer.edit_distance_dc import EditDistance_DC
+from paradigms.divide_and_conquer.edit_distance_hirschberg import EditDistance_Hirschberg
+from paradigms.divide_and_conquer.lis_dc import LIS_DC
+from paradigms.divide_and_conquer.subset_sum_dc import SubsetSum_DC
+from paradigms.divide_and_conquer.subset_sum_mitm import SubsetSum_MITM
+from paradigms.dynamic_programming.lis_dp import LIS_DP
+from paradigms.dynamic_programming.lis_patience import LIS_Patience
+from paradigms.dynamic_programming.subset_sum_dp import SubsetSum_DP
 
 
 class DummyAlgorithm(AlgorithmBase):
@@ -39,6 +54,399 @@ def test_metrics_reset():
     assert algo.metrics['operations_count'] == 0
 
 
+def test_counting_can_be_disabled():
+    """Com a contagem desligada o resultado é o mesmo e operations_count fica zerado"""
+    algo = EditDistance_DP()
+    counted = algo.run("kitten", "sitting")
+    algo.reset_metrics()
+    algo.set_counting(False)
+    timed = algo.run("kitten", "sitting")
+    assert timed['result'] == counted['result'] == 3
+    assert counted['metrics']['operations_count'] == 7 + 8 + 6 * (1 + 3 * 7)
+    assert timed['metrics']['operations_count'] == 0
+
+
+ALL_ALGORITHMS = [
+    NQueensBacktracking, EditDistance_DP, EditDistance_BitParallel, EditDistance_NumPy,
+    EditDistance_DC, EditDistance_Hirschberg, LIS_DC, LIS_DP, LIS_Patience,
+    SubsetSum_DC, SubsetSum_MITM, SubsetSum_DP,
+]
+
+
+class RecordingProbe(Probe):
+    def __init__(self, log, tag):
+        self.log = log
+        self.tag = tag
+    
+    def before(self, algorithm):
+        self.log.append(('before', self.tag))
+    
+    def after(self, algorithm):
+        self.log.append(('after', self.tag, algorithm.metrics['execution_time']))
+
+
+@pytest.mark.parametrize("cls", ALL_ALGORITHMS)
+def test_algorithms_use_base_pipeline(cls):
+    """Nenhum algoritmo sobrescreve run(); todos herdam o pipeline instrumentado"""
+    assert cls.run is AlgorithmBase.run
+
+
+def test_run_pipeline_timer_and_probes():
+    """run() zera as métricas, usa o relógio configurado e chama as sondas em volta de solve()"""
+    ticks = iter([10.0, 12.5])
+    log = []
+    algo = EditDistance_DP()
+    algo.set_timer(lambda: next(ticks))
+    algo.add_probe(RecordingProbe(log, 'a'))
+    algo.add_probe(RecordingProbe(log, 'b'))
+    algo.count(1000)
+    
+    data = algo.run("kitten", "sitting")
+    assert data['result'] == 3
+    assert data['metrics']['execution_time'] == 2.5
+    assert data['metrics']['operations_count'] == 7 + 8 + 6 * (1 + 3 * 7)
+    assert log == [('before', 'a'), ('before', 'b'), ('after', 'b', 2.5), ('after', 'a', 2.5)]
+
+
+def test_run_pipeline_probe_after_runs_on_error():
+    log = []
+    algo = NQueensBacktracking()
+    algo.add_probe(RecordingProbe(log, 'a'))
+    with pytest.raises(ValueError):
+        algo.run(0)
+    assert [entry[0] for entry in log] == ['before', 'after']
+
+
+def test_memory_probe_records_memory_usage():
+    algo = EditDistance_DP()
+    probe = MemoryProbe()
+    algo.add_probe(probe)
+    table = algo.run("ab" * 200, "ba" * 200)['metrics']['memory_usage']
+    algo.remove_probe(probe)
+    assert table > 1
+    assert algo.run("ab", "ba")['metrics']['memory_usage'] < 1
+
+
+def test_run_many_goes_through_pipeline():
+    log = []
+    algo = EditDistance_BitParallel()
+    algo.add_probe(RecordingProbe(log, 'a'))
+    data = algo.run_many("kitten", ["sitting", "kitten", "mitten"])
+    assert data['metrics']['pairs'] == 3
+    assert data['metrics']['pairs_per_second'] > 0
+    assert [entry[0] for entry in log] == ['before', 'after']
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("kitten", "sitting", 3),
+    ("", "abc", 3),
+    ("abc", "", 3),
+    ("flaw", "lawn", 2),
+    ("intention", "execution", 5),
+])
+def test_edit_distance_rolling_matches_table(a, b, expected):
+    """Modo de duas linhas deve produzir a mesma distância da tabela"""
+    assert EditDistance_DP().run(a, b)['result'] == expected
+    assert EditDistance_DP(mode="rolling").run(a, b)['result'] == expected
+
+
+def test_edit_distance_rolling_uses_less_memory():
+    """Modo de duas linhas reporta memória menor que a tabela completa"""
+    a, b = "a" * 300, "b" * 200
+    table = EditDistance_DP().run(a, b)['metrics']['memory_usage']
+    rolling = EditDistance_DP(mode="rolling").run(a, b)['metrics']['memory_usage']
+    assert 0 < rolling < table
+
+
+def test_edit_distance_invalid_mode():
+    with pytest.raises(ValueError):
+        EditDistance_DP(mode="invalido")
+
+
+def _apply_script(script):
+    """Reconstrói (a, b) a partir de um script de edição"""
+    a = ''.join(ca for op, ca, _ in script if op != 'ins')
+    b = ''.join(cb for op, _, cb in script if op != 'del')
+    return a, b
+
+
+def test_hirschberg_script_is_optimal_alignment():
+    """Script do Hirschberg reproduz as strings e tem custo ótimo"""
+    rng = random.Random(0)
+    for _ in range(50):
+        a = ''.join(rng.choices("acgt", k=rng.randint(0, 30)))
+        b = ''.join(rng.choices("acgt", k=rng.randint(0, 30)))
+        result = EditDistance_Hirschberg().run(a, b)['result']
+
+        assert result['distance'] == EditDistance_DP().run(a, b)['result']
+        assert _apply_script(result['script']) == (a, b)
+        for op, ca, cb in result['script']:
+            if op == 'match':
+                assert ca == cb
+            elif op == 'sub':
+                assert ca != cb
+
+
+def test_edit_distance_banded_threshold():
+    """Com max_distance, retorna a distância exata se <= k, senão k + 1"""
+    rng = random.Random(1)
+    for _ in range(200):
+        a = ''.join(rng.choices("ab", k=rng.randint(0, 15)))
+        b = ''.join(rng.choices("ab", k=rng.randint(0, 15)))
+        exact = EditDistance_DP().run(a, b)['result']
+        for k in range(8):
+            expected = exact if exact <= k else k + 1
+            assert EditDistance_DP(max_distance=k).run(a, b)['result'] == expected
+
+
+def test_edit_distance_banded_early_exit():
+    """Strings muito diferentes abortam cedo, com bem menos operações"""
+    a, b = "a" * 500, "b" * 500
+    full = EditDistance_DP(mode="rolling").run(a, b)
+    banded = EditDistance_DP(max_distance=3).run(a, b)
+    assert banded['result'] == 4
+    assert banded['metrics']['operations_count'] < full['metrics']['operations_count'] / 100
+
+
+@pytest.mark.parametrize("word_size", [1, 3, 8, 64, None])
+def test_edit_distance_bitparallel_matches_dp(word_size):
+    """Myers em blocos concorda com a PD, inclusive com vários blocos"""
+    rng = random.Random(word_size or 0)
+    algo = EditDistance_BitParallel(word_size=word_size)
+    for _ in range(100):
+        a = ''.join(rng.choices("abc", k=rng.randint(0, 40)))
+        b = ''.join(rng.choices("abc", k=rng.randint(0, 40)))
+        assert algo.run(a, b)['result'] == EditDistance_DP(mode="rolling").run(a, b)['result']
+
+
+def test_edit_distance_solve_many_filters():
+    """Lote um-contra-muitos: distâncias, limite e top-k"""
+    rng = random.Random(3)
+    query = "banana"
+    candidates = [''.join(rng.choices("abn", k=rng.randint(0, 10))) for _ in range(60)]
+    exact = [EditDistance_DP().run(query, c)['result'] for c in candidates]
+    algo = EditDistance_BitParallel(word_size=4)
+
+    assert algo.solve_many(query, candidates) == list(enumerate(exact))
+    assert algo.solve_many(query, candidates, max_distance=2) == [
+        (i, d) for i, d in enumerate(exact) if d <= 2
+    ]
+    assert algo.solve_many(query, candidates, top_k=5) == sorted(
+        enumerate(exact), key=lambda t: (t[1], t[0])
+    )[:5]
+
+    metrics = algo.run_many(query, candidates, top_k=5)['metrics']
+    assert metrics['pairs'] == len(candidates)
+    assert metrics['pairs_per_second'] > 0
+
+
+def test_edit_distance_numpy_matches_dp():
+    """Varredura por antidiagonais concorda com a PD em Python puro"""
+    rng = random.Random(2)
+    algo = EditDistance_NumPy()
+    for _ in range(100):
+        a = ''.join(rng.choices("abc", k=rng.randint(0, 30)))
+        b = ''.join(rng.choices("abc", k=rng.randint(0, 30)))
+        assert algo.run(a, b)['result'] == EditDistance_DP().run(a, b)['result']
+
+
+def test_lis_patience_matches_dp_and_reconstructs():
+    """Patience sorting dá o mesmo tamanho da PD e uma subsequência válida"""
+    rng = random.Random(4)
+    for _ in range(100):
+        arr = [rng.randint(0, 20) for _ in range(rng.randint(0, 40))]
+        result = LIS_Patience().run(arr)['result']
+        seq = result['subsequence']
+
+        assert result['length'] == LIS_DP().run(arr)['result']
+        assert len(seq) == result['length']
+        assert all(x < y for x, y in zip(seq, seq[1:]))
+        it = iter(arr)
+        assert all(x in it for x in seq)  # é subsequência de arr
+
+
+@pytest.mark.parametrize("cache_size", [None, 3])
+def test_lis_dc_memoized_matches_dp(cache_size):
+    """D&C memoizado (com e sem limite de cache) concorda com a PD"""
+    rng = random.Random(5)
+    for _ in range(50):
+        arr = [rng.randint(0, 20) for _ in range(rng.randint(0, 12))]
+        expected = LIS_DP().run(arr)['result']
+        assert LIS_DC().run(arr)['result'] == expected
+        assert LIS_DC(memoize=True, cache_size=cache_size).run(arr)['result'] == expected
+
+
+def test_lis_dc_memoized_deep_input_uses_iterative_fallback():
+    """Entradas maiores que o limite de recursão não levantam RecursionError"""
+    import sys
+    n = sys.getrecursionlimit() + 200
+    result = LIS_DC(memoize=True).run(list(range(n)))
+    assert result['result'] == n
+    assert result['metrics']['cache_misses'] == n
+    assert result['metrics']['cache_hits'] > 0
+
+
+def test_subset_sum_bitset_matches_table():
+    """Modo bitset concorda com a tabela booleana"""
+    rng = random.Random(6)
+    for _ in range(100):
+        S = [rng.randint(1, 30) for _ in range(rng.randint(0, 10))]
+        T = rng.randint(0, 120)
+        expected = SubsetSum_DP().run(S, T)['result']
+        assert SubsetSum_DP(mode="bitset").run(S, T)['result'] == expected
+
+
+def test_subset_sum_witness_reconstructs_subset():
+    """Modo 1-D devolve um subconjunto válido quando a soma é alcançável"""
+    rng = random.Random(7)
+    for _ in range(100):
+        S = [rng.randint(1, 30) for _ in range(rng.randint(0, 10))]
+        T = rng.randint(0, 120)
+        expected = SubsetSum_DP().run(S, T)['result']
+        result = SubsetSum_DP(mode="witness").run(S, T)['result']
+
+        assert result['found'] == expected
+        if expected:
+            assert sum(result['subset']) == T
+            remaining = list(S)
+            for value in result['subset']:
+                remaining.remove(value)  # cada item usado no máximo uma vez
+        else:
+            assert result['subset'] is None
+
+
+def test_subset_sum_branch_and_bound_matches_dp():
+    """Branch and bound concorda com a PD"""
+    rng = random.Random(9)
+    for _ in range(100):
+        S = [rng.randint(1, 30) for _ in range(rng.randint(0, 12))]
+        T = rng.randint(0, 150)
+        expected = SubsetSum_DP().run(S, T)['result']
+        assert SubsetSum_DC(branch_and_bound=True).run(S, T)['result'] == expected
+
+
+def test_subset_sum_branch_and_bound_skips_worst_case_tree():
+    """No pior caso do gerador a poda por soma restante corta a árvore inteira"""
+    from datasets.generators import DataGenerator
+    DataGenerator.set_seed(42)
+    S, T = DataGenerator.generate_subset_sum_instance(14, worst_case=True)
+
+    plain = SubsetSum_DC().run(S, T)['metrics']
+    bnb = SubsetSum_DC(branch_and_bound=True).run(S, T)['metrics']
+    assert bnb['tree_size'] == 2 ** 15 - 1
+    assert bnb['nodes_visited'] < plain['operations_count']
+
+
+def test_subset_sum_mitm_matches_dp():
+    """Meet-in-the-middle concorda com a PD"""
+    rng = random.Random(8)
+    for _ in range(100):
+        S = [rng.randint(1, 30) for _ in range(rng.randint(0, 10))]
+        T = rng.randint(0, 120)
+        assert SubsetSum_MITM().run(S, T)['result'] == SubsetSum_DP().run(S, T)['result']
+
+
+def test_subset_sum_mitm_huge_values():
+    """Custo não depende do valor do target"""
+    S = [10**12 + i * 7919 for i in range(16)]
+    assert SubsetSum_MITM().run(S, S[1] + S[5] + S[11])['result'] is True
+    assert SubsetSum_MITM().run(S, S[1] + S[5] + 1)['result'] is False
+
+
+def test_subset_sum_bitset_large_target():
+    """Targets na casa dos milhões continuam baratos em memória"""
+    S = [10**6, 3 * 10**6 + 1, 7]
+    result = SubsetSum_DP(mode="bitset").run(S, 4 * 10**6 + 1)
+    assert result['result'] is True
+    assert result['metrics']['memory_usage'] < 1  # MB
+    assert SubsetSum_DP(mode="bitset").run(S, 4 * 10**6 + 2)['result'] is False
+
+
+def _without_time(metrics):
+    return {k: v for k, v in metrics.items() if k != 'execution_time'}
+
+
+def test_iterative_paths_match_recursion():
+    """Pilha explícita dá o mesmo resultado e as mesmas métricas da recursão"""
+    rng = random.Random(11)
+    for _ in range(30):
+        a = ''.join(rng.choices("ab", k=rng.randint(0, 5)))
+        b = ''.join(rng.choices("ab", k=rng.randint(0, 5)))
+        arr = [rng.randint(0, 9) for _ in range(rng.randint(0, 8))]
+        S = [rng.randint(1, 20) for _ in range(rng.randint(0, 8))]
+        T = rng.randint(0, 60)
+        pairs = [
+            (EditDistance_DC(iterative=False), EditDistance_DC(iterative=True), (a, b)),
+            (LIS_DC(iterative=False), LIS_DC(iterative=True), (arr,)),
+            (LIS_DC(memoize=True, iterative=False), LIS_DC(memoize=True, iterative=True), (arr,)),
+            (SubsetSum_DC(iterative=False), SubsetSum_DC(iterative=True), (S, T)),
+            (SubsetSum_DC(True, iterative=False), SubsetSum_DC(True, iterative=True), (S, T)),
+        ]
+        for recursive, iterative, args in pairs:
+            expected = recursive.run(*args)
+            got = iterative.run(*args)
+            assert got['result'] == expected['result']
+            assert _without_time(got['metrics']) == _without_time(expected['metrics'])
+
+
+def test_iterative_paths_handle_deep_instances():
+    """Profundidade acima do limite de recursão não levanta RecursionError"""
+    import sys
+    depth = sys.getrecursionlimit() + 200
+    assert EditDistance_DC().run("a" * depth, "b")['result'] == depth
+    assert SubsetSum_DC().run([1] * depth, 1)['result'] is True
+    assert SubsetSum_DC(branch_and_bound=True).run([1] * depth, depth - 1)['result'] is True
+    with pytest.raises(RecursionError):
+        SubsetSum_DC(iterative=False).run([1] * depth, 1)
+
+
+N_QUEENS_COUNTS = [1, 0, 0, 2, 10, 4, 40, 92, 352]
+
+
+@pytest.mark.parametrize("n", range(1, 10))
+def test_n_queens_solutions(n):
+    """Contagem, lista e gerador concordam e só produzem tabuleiros válidos"""
+    count = NQueensBacktracking(count_only=True).run(n)['result']
+    solutions = NQueensBacktracking().run(n)['result']
+
+    assert count == len(solutions) == N_QUEENS_COUNTS[n - 1]
+    assert len({tuple(s) for s in solutions}) == len(solutions)
+    for sol in solutions:
+        assert sorted(sol) == list(range(n))
+        assert len({r + c for r, c in enumerate(sol)}) == n
+        assert len({r - c for r, c in enumerate(sol)}) == n
+
+
+def test_n_queens_generator_is_lazy():
+    """O gerador entrega a primeira solução sem percorrer a árvore inteira"""
+    algo = NQueensBacktracking()
+    first = next(algo.iter_solutions(12))
+    assert len(first) == 12
+    total = NQueensBacktracking(count_only=True).run(12)['metrics']['operations_count']
+    assert 0 < algo.metrics['operations_count'] < total / 100
+
+
+@pytest.mark.parametrize("n", [1, 4, 8, 9])
+def test_n_queens_counts_nodes_in_both_modes(n):
+    """Contagem e lista de soluções reportam os mesmos nós visitados"""
+    count_ops = NQueensBacktracking(count_only=True).run(n)['metrics']['operations_count']
+    list_ops = NQueensBacktracking().run(n)['metrics']['operations_count']
+    assert count_ops == list_ops
+
+
+@pytest.mark.parametrize("n", [1, 6, 8, 9])
+def test_n_queens_parallel_matches_serial(n):
+    """A divisão em processos reproduz a contagem e o conjunto de soluções"""
+    counted = NQueensBacktracking(count_only=True, workers=2).run(n)
+    assert counted['result'] == N_QUEENS_COUNTS[n - 1]
+    serial = NQueensBacktracking().run(n)
+    parallel = NQueensBacktracking().run(n, workers=2)
+    assert sorted(map(tuple, parallel['result'])) == sorted(map(tuple, serial['result']))
+    # Mesma árvore percorrida, mesma contagem de nós
+    ops = serial['metrics']['operations_count']
+    assert parallel['metrics']['operations_count'] == counted['metrics']['operations_count'] == ops
+
+
 # TODO: Adicionar mais testes quando algoritmos forem implementados
 
 if __name__ == "__main__":
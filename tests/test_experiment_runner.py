@@ -0,0 +1,428 @@
+"""
+Tests for ExperimentRunner
+"""
+
+import json
+import math
+import os
+import pstats
+import threading
+import time
+
+import numpy as np
+import pytest
+from core.algorithm_base import AlgorithmBase
+from core.experiment_runner import ExperimentRunner, TIMEOUT
+from core.columnar import NPZ, PARQUET, export_columnar, load_columnar
+from core.complexity import fit_complexity, max_size_within
+from core.metrics import MemoryProfiler, summarize_samples
+from core.result_sink import ResultSink, read_results
+from core.visualizer import Visualizer
+from paradigms.backtracking.n_queens_bt import NQueensBacktracking
+from paradigms.dynamic_programming.edit_distance_dp import EditDistance_DP
+from paradigms.dynamic_programming.lis_dp import LIS_DP
+from paradigms.dynamic_programming.subset_sum_dp import SubsetSum_DP
+
+
+class SleepAlgorithm(AlgorithmBase):
+    """Dorme n * 0.1 s, para simular um algoritmo que explode com n"""
+    
+    def __init__(self):
+        super().__init__("Sleep")
+    
+    def solve(self, n):
+        time.sleep(n * 0.1)
+        return n
+
+
+class DoubleAlgorithm(AlgorithmBase):
+    def __init__(self):
+        super().__init__("Double")
+    
+    def solve(self, n):
+        return n * 2
+
+
+class CallLogAlgorithm(AlgorithmBase):
+    """Registra os parâmetros com que solve() foi chamado"""
+    
+    def __init__(self):
+        super().__init__("CallLog")
+        self.calls = []
+    
+    def solve(self, n):
+        self.calls.append(n)
+        return n + 1
+
+
+def sleep_dataset(n):
+    return (n,)
+
+
+def subset_dataset(n):
+    return (list(range(1, n + 1)), n * (n + 1) // 2 + 1)
+
+
+def _strip(results):
+    """Remove campos que variam entre execuções (tempo e timestamp)"""
+    return [
+        (r['parameter'] if 'parameter' in r else r['test_case'],
+         r['algorithm'], r['repetition'], r['result'], r['metrics']['operations_count'])
+        for r in results
+    ]
+
+
+def test_run_experiment_parallel_matches_serial(tmp_path):
+    """Com workers, resultados e ordem são os mesmos da execução em série"""
+    algos = [LIS_DP()]
+    cases = [
+        {'name': 'lis', 'args': [[3, 1, 4, 1, 5, 9, 2, 6]]},
+        {'name': 'lis2', 'args': [[5, 4, 3, 2, 1]]},
+    ]
+    serial = ExperimentRunner("serial", output_dir=tmp_path).run_experiment(algos, cases, repetitions=2)
+    parallel = ExperimentRunner("par", output_dir=tmp_path, workers=2).run_experiment(algos, cases, repetitions=2)
+    assert _strip(parallel) == _strip(serial)
+
+
+def test_run_series_parallel_matches_serial(tmp_path):
+    algos = [SubsetSum_DP(), SubsetSum_DP(mode="bitset")]
+    params = [4, 8, 12]
+    serial = _strip(ExperimentRunner("serial", output_dir=tmp_path).run_series(
+        algos, subset_dataset, params, repetitions=2))
+    runner = ExperimentRunner("par", output_dir=tmp_path, pin_workers=True)
+    parallel = runner.run_series(algos, subset_dataset, params, repetitions=2, workers=3)
+
+    assert _strip(parallel) == serial
+    assert [r['parameter'] for r in parallel] == [p for p in params for _ in range(4)]
+    assert os.path.exists(tmp_path / "experiment_comparison.png")
+
+
+def test_invalid_workers(tmp_path):
+    with pytest.raises(ValueError):
+        ExperimentRunner("x", output_dir=tmp_path, workers=0)
+
+
+def test_get_speedup(tmp_path):
+    runner = ExperimentRunner("x", output_dir=tmp_path)
+    runner.results = [
+        {'algorithm': 'A', 'parameter': 1, 'metrics': {'execution_time': 4.0}},
+        {'algorithm': 'A', 'parameter': 2, 'metrics': {'execution_time': 2.0}},
+        {'algorithm': 'A', 'parameter': 4, 'metrics': {'execution_time': 1.5}},
+        {'algorithm': 'A', 'parameter': 4, 'metrics': {'execution_time': 0.5}},
+    ]
+    assert runner.get_speedup(baseline=1) == {'A': {1: 1.0, 2: 2.0, 4: 4.0}}
+
+
+def test_run_series_timeout_stops_escalating(tmp_path):
+    """Execuções acima do limite viram marcadores e o algoritmo sai da série"""
+    runner = ExperimentRunner("timeout", output_dir=tmp_path)
+    start = time.monotonic()
+    results = runner.run_series([SleepAlgorithm()], sleep_dataset, [1, 30, 40], repetitions=2, timeout=1.0)
+    assert time.monotonic() - start < 10
+
+    # n=1 roda duas vezes; n=30 estoura na primeira repetição; n=40 nem roda
+    assert [(r['parameter'], r.get('status')) for r in results] == [(1, None), (1, None), (30, TIMEOUT)]
+    assert results[-1]['result'] is None
+    assert runner.get_speedup(baseline=1) == {'Sleep': {1: 1.0}}
+
+
+def test_run_series_timeout_keeps_other_algorithms(tmp_path):
+    runner = ExperimentRunner("timeout", output_dir=tmp_path, workers=2)
+    results = runner.run_series(
+        [SleepAlgorithm(), DoubleAlgorithm()], sleep_dataset, [1, 30, 40], repetitions=1, timeout=1.0
+    )
+    assert [(r['parameter'], r['algorithm'], r['result']) for r in results] == [
+        (1, 'Sleep', 1), (1, 'Double', 2),
+        (30, 'Sleep', None), (30, 'Double', 60),
+        (40, 'Double', 80),
+    ]
+
+
+def test_run_series_timeout_streams_records_before_batch_ends(tmp_path):
+    """Com timeout, cada registro é gravado sem esperar o resto do parâmetro"""
+    runner = ExperimentRunner("timeout", output_dir=tmp_path)
+    path = tmp_path / "serie.jsonl"
+    seen = []
+    done = threading.Event()
+    
+    def watch():
+        while not done.is_set() and not seen:
+            if path.exists() and path.stat().st_size > 0:
+                seen.append(time.monotonic())
+            time.sleep(0.05)
+    
+    watcher = threading.Thread(target=watch)
+    watcher.start()
+    try:
+        runner.run_series([DoubleAlgorithm(), SleepAlgorithm()], sleep_dataset, [50],
+                          repetitions=1, timeout=3.0, stream="serie.jsonl")
+        end = time.monotonic()
+    finally:
+        done.set()
+        watcher.join()
+    
+    # O registro de Double aparece enquanto Sleep ainda roda até o limite
+    assert seen and seen[0] < end - 1.0
+    assert [(r['algorithm'], r.get('status')) for r in read_results(path)] == [('Double', None), ('Sleep', TIMEOUT)]
+
+
+def test_run_series_timeout_with_parallel_algorithm(tmp_path):
+    """O processo de cada execução com limite pode criar seus próprios workers"""
+    runner = ExperimentRunner("timeout", output_dir=tmp_path)
+    results = runner.run_series(
+        [NQueensBacktracking(count_only=True)], lambda w: (8, w), [1, 2], repetitions=1, timeout=20
+    )
+    assert [(r['parameter'], r.get('status'), r['result']) for r in results] == [(1, None, 92), (2, None, 92)]
+
+
+def test_summarize_samples():
+    stats = summarize_samples([1.0, 2.0, 3.0, 4.0, 100.0])
+    assert stats['n'] == 5
+    assert stats['median'] == 3.0
+    assert stats['iqr'] == 2.0
+    assert stats['ci_low'] <= stats['median'] <= stats['ci_high']
+    assert summarize_samples([2.0])['ci_low'] == summarize_samples([2.0])['ci_high'] == 2.0
+
+
+def test_run_series_benchmark_mode(tmp_path):
+    """Modo benchmark calibra o laço interno e anexa estatísticas aos registros"""
+    runner = ExperimentRunner("bench", output_dir=tmp_path)
+    results = runner.run_series(
+        [LIS_DP()], lambda n: (list(range(n)),), [5, 10], repetitions=4,
+        benchmark=True, warmup=1, min_time=0.01
+    )
+    assert [(r['parameter'], r['repetition']) for r in results] == [
+        (5, 1), (5, 2), (5, 3), (5, 4), (10, 1), (10, 2), (10, 3), (10, 4)
+    ]
+    for r in results:
+        assert r['result'] == r['parameter']
+        assert r['metrics']['inner_loops'] > 1
+        stats = r['statistics']
+        assert stats['n'] == 4
+        assert stats['q1'] <= stats['median'] <= stats['q3']
+        assert stats['ci_low'] <= stats['median'] <= stats['ci_high']
+
+
+def test_run_series_benchmark_inline_counts_one_execution(tmp_path):
+    """O laço interno zera as métricas uma vez, mas o registro traz a contagem de uma execução"""
+    expected = LIS_DP().run(list(range(10)))['metrics']['operations_count']
+    runner = ExperimentRunner("bench", output_dir=tmp_path)
+    results = runner.run_series(
+        [LIS_DP()], lambda n: (list(range(n)),), [10], repetitions=2,
+        benchmark=True, warmup=0, min_time=0.01, separate_counting=False
+    )
+    for r in results:
+        assert r['metrics']['inner_loops'] > 1
+        assert r['metrics']['operations_count'] == expected
+
+
+@pytest.mark.parametrize("model, fn", [
+    ('n', lambda n: 3e-7 * n),
+    ('n log n', lambda n: 1e-6 * n * math.log2(n)),
+    ('n^2', lambda n: 1e-8 * n * n),
+    ('2^n', lambda n: 1e-7 * 2 ** n),
+    ('3^n', lambda n: 1e-9 * 3 ** n),
+])
+def test_fit_complexity_recovers_model(model, fn):
+    sizes = list(range(4, 24))
+    fit = fit_complexity(sizes, [fn(n) for n in sizes])
+    assert fit['best'] == model
+    assert fit['models'][model]['r2'] > 0.999
+
+
+def test_fit_complexity_nm_and_budget():
+    sizes = [(n, 2 * n) for n in range(10, 200, 10)]
+    fit = fit_complexity(sizes, [1e-8 * n * m for n, m in sizes], models=['n', 'nm', '2^n'])
+    assert fit['best'] == 'nm'
+    assert fit['exponent'] == pytest.approx(2.0)
+    # 1e-8 * n * 2n <= 1  =>  n <= 7071
+    assert max_size_within(fit, 1.0) == 7071
+
+
+def test_analyze_complexity(tmp_path):
+    """A análise usa a mediana por parâmetro e ignora marcadores de timeout"""
+    runner = ExperimentRunner("cx", output_dir=tmp_path)
+    runner.results = [
+        {'algorithm': 'Quad', 'parameter': n, 'metrics': {'execution_time': 1e-6 * n * n * f}}
+        for n in range(10, 60, 10) for f in (0.9, 1.0, 1.5)
+    ] + [{'algorithm': 'Quad', 'parameter': 80, 'metrics': {}, 'status': TIMEOUT}]
+    analysis = runner.analyze_complexity(budget=1.0)
+
+    assert analysis['Quad']['best'] == 'n^2'
+    assert analysis['Quad']['max_n_within_budget'] == 1000
+    assert os.path.exists(tmp_path / "cx_complexity.json")
+
+    Visualizer(output_dir=tmp_path).plot_complexity_analysis(runner.results, fits=analysis, save_as="cx.png")
+    assert os.path.exists(tmp_path / "cx.png")
+
+
+def test_separate_counting_passes(tmp_path):
+    """Passes de tempo sem contagem reportam as operações do passe de contagem"""
+    lis_cases = [{'name': 'a', 'args': [[3, 1, 4, 1, 5, 9, 2, 6]]}]
+    inline = ExperimentRunner("inline", output_dir=tmp_path).run_experiment(
+        [LIS_DP()], lis_cases, repetitions=3, separate_counting=False)
+    separate = ExperimentRunner("sep", output_dir=tmp_path).run_experiment(
+        [LIS_DP()], lis_cases, repetitions=3)
+    assert _strip(separate) == _strip(inline)
+
+    algo = SubsetSum_DP()
+    series = ExperimentRunner("sep", output_dir=tmp_path).run_series(
+        [algo], subset_dataset, [4, 8], repetitions=3)
+    expected = {n: SubsetSum_DP().run(*subset_dataset(n))['metrics']['operations_count'] for n in (4, 8)}
+    assert [r['metrics']['operations_count'] for r in series] == [expected[4]] * 3 + [expected[8]] * 3
+    assert algo.counting_enabled
+
+
+def test_memory_profiler_sees_table_peak():
+    with MemoryProfiler(sample_rss=True) as profiler:
+        table = [[0] * 1000 for _ in range(1000)]
+        del table
+    results = profiler.get_results()
+    assert results['traced_peak_mb'] > 7
+    assert results['rss_peak_mb'] > 0
+
+
+def test_run_series_memory_profile(tmp_path):
+    """O passe de memória distingue a tabela completa da versão em duas linhas"""
+    algos = [EditDistance_DP(), EditDistance_DP(mode="rolling")]
+    runner = ExperimentRunner("mem", output_dir=tmp_path)
+    results = runner.run_series(
+        algos, lambda n: ("ab" * n, "ba" * n), [100, 200], repetitions=2,
+        memory_profile=True, sample_rss=True
+    )
+    memory = {(r['parameter'], r['algorithm']): r['metrics']['memory_usage'] for r in results}
+    for n in (100, 200):
+        assert memory[(n, algos[0].name)] > 5 * memory[(n, algos[1].name)] > 0
+    assert all('memory_rss_peak' in r['metrics'] for r in results)
+    assert os.path.exists(tmp_path / "experiment_memory.png")
+
+
+def test_run_series_profile(tmp_path):
+    """Os parâmetros selecionados ganham .pstats e .collapsed ligados aos registros"""
+    runner = ExperimentRunner("prof", output_dir=tmp_path)
+    results = runner.run_series(
+        [LIS_DP()], lambda n: (list(range(n)),), [5, 200], repetitions=2, profile=[200]
+    )
+    assert [r.get('profile') is not None for r in results] == [False, False, True, True]
+    link = results[-1]['profile']
+    assert set(link) == {'pstats', 'collapsed'}
+    
+    stats = pstats.Stats(str(tmp_path / link['pstats']))
+    assert any(func[2] == '_lis_algorithm' for func in stats.stats)
+    lines = (tmp_path / link['collapsed']).read_text().splitlines()
+    assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+    assert any(line.startswith('paradigms.dynamic_programming.lis_dp:LIS_DP.solve;') for line in lines)
+    
+    saved = json.loads(next(tmp_path.glob("prof_*.json")).read_text())
+    assert saved[-1]['profile'] == link
+
+
+def test_run_series_stream_and_resume(tmp_path):
+    """Cada execução vira uma linha do JSONL; a retomada só executa o que falta"""
+    params = [1, 2, 3]
+    runner = ExperimentRunner("stream", output_dir=tmp_path)
+    first = runner.run_series([CallLogAlgorithm()], sleep_dataset, params, repetitions=2,
+                              separate_counting=False, stream="serie.jsonl")
+    path = tmp_path / "serie.jsonl"
+    assert [(r['parameter'], r['repetition'], r['result']) for r in read_results(path)] == \
+        [(r['parameter'], r['repetition'], r['result']) for r in first]
+    assert not list(tmp_path.glob("stream_*.json"))
+    
+    # Falha no meio da escrita do 4º registro: sobram 3 linhas e um pedaço
+    lines = path.read_text().splitlines(keepends=True)
+    path.write_text("".join(lines[:3]) + lines[3][:10])
+    assert len(list(read_results(path))) == 3
+    
+    algo = CallLogAlgorithm()
+    resumed = runner.run_series([algo], sleep_dataset, params, repetitions=2,
+                                separate_counting=False, stream="serie.jsonl", resume=True)
+    assert algo.calls == [2, 3, 3]
+    assert [(r['parameter'], r['repetition']) for r in resumed] == [(p, k) for p in params for k in (1, 2)]
+    assert [(r['parameter'], r['repetition']) for r in read_results(path)] == \
+        [(p, k) for p in params for k in (1, 2)]
+
+
+def test_run_series_stream_without_results_in_memory(tmp_path):
+    runner = ExperimentRunner("lazy", output_dir=tmp_path)
+    results = runner.run_series([SubsetSum_DP()], subset_dataset, [4, 8], repetitions=2,
+                                stream="lazy.jsonl", keep_results=False)
+    assert results == []
+    assert set(runner.get_speedup(baseline=4)[SubsetSum_DP().name]) == {4, 8}
+    ops = [r['metrics']['operations_count'] for r in read_results(tmp_path / "lazy.jsonl")]
+    assert ops[0] == ops[1] > 0
+    with pytest.raises(ValueError):
+        runner.run_series([SubsetSum_DP()], subset_dataset, [4], keep_results=False)
+
+
+def test_result_sink_flushes_periodically(tmp_path):
+    path = tmp_path / "sink.jsonl"
+    with ResultSink(path, flush_interval=0) as sink:
+        sink.write({'algorithm': 'A', 'parameter': (1, 2), 'repetition': 1, 'metrics': {}})
+        assert path.read_text().count("\n") == 1
+    with ResultSink(path, resume=True) as sink:
+        assert ('A', '[1, 2]', 1) in sink.completed
+
+
+def test_result_sink_flushes_idle_burst(tmp_path):
+    """Uma rajada de registros chega ao disco mesmo sem escritas seguintes"""
+    path = tmp_path / "burst.jsonl"
+    with ResultSink(path, flush_interval=0.2) as sink:
+        for k in range(3):
+            sink.write({'algorithm': 'A', 'parameter': 1, 'repetition': k + 1, 'metrics': {}})
+        time.sleep(1.0)
+        assert [r['repetition'] for r in read_results(path)] == [1, 2, 3]
+
+
+def test_result_sink_resume_keeps_complete_tail(tmp_path):
+    """Retomada e leitura concordam: última linha válida sem '\\n' é mantida"""
+    path = tmp_path / "tail.jsonl"
+    path.write_text('{"algorithm":"A","parameter":1,"repetition":1}\n'
+                    '{"algorithm":"A","parameter":1,"repetition":2}')
+    assert len(list(read_results(path))) == 2
+    with ResultSink(path, resume=True) as sink:
+        assert ('A', '1', 2) in sink.completed
+        sink.write({'algorithm': 'A', 'parameter': 1, 'repetition': 3})
+    assert [r['repetition'] for r in read_results(path)] == [1, 2, 3]
+
+
+def test_export_columnar_npz_memory_maps_numeric_columns(tmp_path):
+    runner = ExperimentRunner("cols", output_dir=tmp_path)
+    results = runner.run_series([SubsetSum_DP(), SubsetSum_DP(mode="bitset")], subset_dataset, [4, 8],
+                                repetitions=2, benchmark=True, min_time=0.001)
+    path = runner.export_columnar(fmt=NPZ)
+    assert path == tmp_path / "cols.npz"
+    
+    columns = load_columnar(path)
+    assert 'result' not in columns
+    assert isinstance(columns['metrics.execution_time'], np.memmap)
+    assert isinstance(columns['statistics.median'], np.memmap)
+    assert columns['repetition'].dtype == np.int64
+    assert columns['timestamp'].dtype == np.dtype('datetime64[us]')
+    assert list(columns['algorithm']) == [r['algorithm'] for r in results]
+    assert np.allclose(columns['metrics.execution_time'], [r['metrics']['execution_time'] for r in results])
+    assert list(columns['metrics.operations_count']) == [r['metrics']['operations_count'] for r in results]
+
+
+def test_export_columnar_mixed_records(tmp_path):
+    """Colunas ausentes viram NaN/'' e parâmetros-tupla viram texto JSON"""
+    records = [
+        {'algorithm': 'A', 'parameter': (2, 3), 'repetition': 1, 'result': [1],
+         'metrics': {'execution_time': 0.5, 'operations_count': 7}},
+        {'algorithm': 'A', 'parameter': (4, 6), 'repetition': 1, 'result': None,
+         'metrics': {}, 'status': TIMEOUT},
+    ]
+    columns = load_columnar(export_columnar(records, tmp_path / "mixed", include_result=True, fmt=NPZ))
+    assert list(columns['parameter']) == ['[2, 3]', '[4, 6]']
+    assert list(columns['status']) == ['', TIMEOUT]
+    assert list(columns['result']) == ['[1]', '']
+    assert columns['metrics.operations_count'][0] == 7
+    assert np.isnan(columns['metrics.execution_time'][1])
+
+
+def test_export_columnar_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    records = [{'algorithm': 'A', 'parameter': n, 'repetition': 1, 'metrics': {'execution_time': n / 10}}
+               for n in range(5)]
+    columns = load_columnar(export_columnar(records, tmp_path / "hist", fmt=PARQUET))
+    assert list(columns['parameter']) == list(range(5))
+    assert np.allclose(columns['metrics.execution_time'], [n / 10 for n in range(5)])